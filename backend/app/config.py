@@ -1,11 +1,28 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import List
 
 
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./data/blog.db"
 
+    # Connection pools (primary: writes and admin; read: public GET traffic)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_READ_POOL_SIZE: int = 10
+    DB_READ_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+
+    # SQLite tuning, applied to every new connection (ignored for other databases)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # readers no longer block on the writer
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # durable across app crashes; WAL fsyncs at checkpoints
+    SQLITE_BUSY_TIMEOUT: int = 5000  # ms to wait for a lock before "database is locked"
+    SQLITE_CACHE_SIZE: int = -65536  # pages, or KiB when negative (64MB)
+    SQLITE_MMAP_SIZE: int = 268435456  # 256MB
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_FOREIGN_KEYS: bool = True
+
     # JWT Settings
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
@@ -17,6 +34,45 @@ class Settings(BaseSettings):
     # Upload Settings
     UPLOAD_DIR: str = "./data/uploads"
     MAX_UPLOAD_SIZE: int = 5242880  # 5MB
+    UPLOAD_CACHE_MAX_BYTES: int = 33554432  # 32MB of small files kept in memory
+    UPLOAD_CACHE_MAX_FILE_SIZE: int = 262144  # 256KB; larger files are streamed
+
+    # Responsive image variants (requires Pillow; AVIF needs a Pillow build with AVIF support)
+    IMAGE_VARIANT_WIDTHS: List[int] = [320, 640, 1280]
+    IMAGE_VARIANT_FORMATS: List[str] = ["avif", "webp"]
+    IMAGE_VARIANT_QUALITY: int = 75
+    IMAGE_WORKERS: int = 2
+
+    # View counter write-behind
+    VIEW_COUNT_FLUSH_INTERVAL: float = 5.0  # seconds
+
+    # Listing total count cache
+    COUNT_CACHE_TTL: float = 60.0  # seconds
+
+    # Public response cache
+    RESPONSE_CACHE_TTL: float = 30.0  # seconds
+
+    # Authenticated admin cache
+    ADMIN_CACHE_TTL: float = 300.0  # seconds
+
+    # Password hashing (bcrypt) executor
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 16  # waiting calls before answering 503
+
+    # NDJSON export / import (admin)
+    EXPORT_BATCH_SIZE: int = 2000  # rows fetched from the cursor per chunk
+    IMPORT_BATCH_SIZE: int = 1000  # rows inserted and committed together
+    IMPORT_MAX_LINE_SIZE: int = 1048576  # 1MB
+    IMPORT_MAX_ERRORS: int = 100  # errors listed in the report (all are counted)
+
+    # SQL profiler (per-route query counts in /metrics, slow-query log, repeated statements)
+    SQL_PROFILER_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 100.0  # logged with their EXPLAIN QUERY PLAN
+    REPEATED_QUERY_THRESHOLD: int = 10  # warn when one statement shape runs more often in a request
+    SERVER_TIMING_HEADER: bool = False  # send database time and query count as Server-Timing
+
+    # Readiness probe (/health/ready)
+    READINESS_DB_TIMEOUT: float = 2.0  # seconds before a database counts as unavailable
 
     class Config:
         env_file = ".env"
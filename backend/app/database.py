@@ -1,31 +1,171 @@
-from sqlalchemy import create_engine
+from typing import Dict, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
+from app.utils.db_pool import PoolStats, instrumented_pool, track_hold_time
+from app.utils.query_profiler import install_query_profiler
 
 # SQLite 설정
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
+
+def _async_database_url(url: str) -> str:
+    """Map a sync database URL onto its asyncio driver (sqlite -> aiosqlite)."""
+    parsed = make_url(url)
+    if parsed.drivername == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+def _read_only_database_url(url: str) -> str:
+    """
+    The async URL opened read-only (SQLite `mode=ro` URI), or the primary URL
+    where that is not possible (in-memory and non-SQLite databases).
+    """
+    parsed = make_url(_async_database_url(url))
+    if parsed.get_backend_name() != "sqlite" or parsed.database in (None, "", ":memory:"):
+        return parsed.render_as_string(hide_password=False)
+    database = parsed.database if parsed.database.startswith("file:") else f"file:{parsed.database}"
+    parsed = parsed.set(database=database, query={**parsed.query, "mode": "ro", "uri": "true"})
+    return parsed.render_as_string(hide_password=False)
+
+
+def sqlite_pragmas() -> Dict[str, Union[str, int]]:
+    """PRAGMAs applied to every SQLite connection, from Settings."""
+    return {
+        # journal_mode goes first: it cannot change inside a transaction
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "foreign_keys": "ON" if settings.SQLITE_FOREIGN_KEYS else "OFF",
+    }
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: Dict[str, Union[str, int]]) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            if isinstance(value, str) and not value.isalnum():
+                raise ValueError(f"Invalid value for PRAGMA {name}: {value!r}")
+            cursor.execute(f"PRAGMA {name} = {value}")
+    finally:
+        cursor.close()
+
+
+def install_sqlite_pragmas(sync_engine, pragmas: Dict[str, Union[str, int]]) -> None:
+    """Apply `pragmas` to each new connection of a SQLite engine (no-op for other databases)."""
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+
+# Sync engine: used by the maintenance scripts in scripts/
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False}  # SQLite only
 )
 
+install_sqlite_pragmas(engine, sqlite_pragmas())
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Checkout counters per pool, reported by /api/admin/system
+pool_stats = {"primary": PoolStats("primary"), "read": PoolStats("read")}
+
+# Async engine: used by the API so queries never block the event loop.
+# Takes every write and any read that must see the session's own changes.
+async_engine = create_async_engine(
+    _async_database_url(SQLALCHEMY_DATABASE_URL),
+    poolclass=instrumented_pool(AsyncAdaptedQueuePool, pool_stats["primary"]),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT
+)
+install_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas())
+track_hold_time(async_engine.sync_engine, pool_stats["primary"])
+
+# Read-only engine: public GET traffic, with its own pool so heavy reads do
+# not queue behind admin writes for connections. Opened with mode=ro and
+# query_only, so a stray write fails instead of taking the write lock.
+read_engine = create_async_engine(
+    _read_only_database_url(SQLALCHEMY_DATABASE_URL),
+    poolclass=instrumented_pool(AsyncAdaptedQueuePool, pool_stats["read"]),
+    pool_size=settings.DB_READ_POOL_SIZE,
+    max_overflow=settings.DB_READ_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT
+)
+# journal_mode is a database-level setting owned by the primary; a read-only
+# connection cannot change it
+install_sqlite_pragmas(read_engine.sync_engine, {
+    **{name: value for name, value in sqlite_pragmas().items() if name != "journal_mode"},
+    "query_only": "ON",
+})
+track_hold_time(read_engine.sync_engine, pool_stats["read"])
+
+# Per-request query counts and the slow-query log (the API's engines only)
+if settings.SQL_PROFILER_ENABLED:
+    install_query_profiler(async_engine.sync_engine)
+    install_query_profiler(read_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """Dependency to get database session"""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+async def get_read_db():
+    """Dependency to get a read-only database session (public GET endpoints)"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """Checkout and wait statistics of the primary and read-only pools."""
+    return {
+        "primary": pool_stats["primary"].stats(async_engine.pool),
+        "read": pool_stats["read"].stats(read_engine.pool),
+    }
+
+
+async def init_db():
     """Initialize database tables"""
-    from app.models import post, contact, admin, service  # noqa: F401
-    Base.metadata.create_all(bind=engine)
+    from app.models import post, contact, admin, service, counter, image_variant, upload  # noqa: F401
+    from app.migrations import run_migrations
+    from app.services.stats import install_counter_triggers, recompute_counters
+    from app.services.versions import install_version_triggers
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
+        # Dashboard counters: triggers keep them current, a rebuild heals any drift
+        await conn.run_sync(install_counter_triggers)
+        await conn.run_sync(recompute_counters)
+        # Row and table versions behind ETag / Last-Modified
+        await conn.run_sync(install_version_triggers)
@@ -1,24 +1,51 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
+from sqlalchemy import text
+import asyncio
 import os
+import time
 
 from app.config import settings
-from app.database import init_db
-from app.routers import posts, contacts, auth, admin, services, home
+from app.database import init_db, async_engine, read_engine
+from app.routers import posts, contacts, auth, admin, services, home, search
+from app.services.view_counter import view_counter
+from app.services.images import image_processor
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_profiler import QueryProfilerMiddleware
+from app.utils.hashing import hashing_executor
+from app.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics
+from app.utils.static_files import UploadFiles, file_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Initialize database
-    init_db()
+    await init_db()
 
     # Ensure upload directory exists
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
+    # Periodically write buffered post view counts back to the database
+    flush_task = asyncio.create_task(view_counter.run_periodic_flush(settings.VIEW_COUNT_FLUSH_INTERVAL))
+
     yield
-    # Shutdown: cleanup if needed
+
+    # Shutdown: stop the flush timer and persist any remaining view counts
+    flush_task.cancel()
+    try:
+        await flush_task
+    except asyncio.CancelledError:
+        pass
+    await view_counter.flush()
+
+    hashing_executor.shutdown()
+    image_processor.shutdown()
+
+    # Shutdown: release pooled database connections
+    await async_engine.dispose()
+    await read_engine.dispose()
 
 
 app = FastAPI(
@@ -37,8 +64,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Static files for uploads
-app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+# Per-request SQL profiling (query counts per route, N+1 warnings, Server-Timing)
+if settings.SQL_PROFILER_ENABLED:
+    app.add_middleware(QueryProfilerMiddleware)
+
+# Per-route request metrics, exposed at /metrics (outermost, so it times everything)
+app.add_middleware(MetricsMiddleware)
+
+# Static files for uploads (immutable caching for hashed names, ranges, precompression)
+app.mount("/uploads", UploadFiles(directory=settings.UPLOAD_DIR, cache=file_cache), name="uploads")
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -47,6 +81,7 @@ app.include_router(contacts.router, prefix="/api/contacts", tags=["Contacts"])
 app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
 app.include_router(services.router, prefix="/api/services", tags=["Services"])
 app.include_router(home.router, prefix="/api/home", tags=["Home"])
+app.include_router(search.router, prefix="/api/search", tags=["Search"])
 
 
 @app.get("/")
@@ -57,3 +92,35 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+async def _select_one(engine) -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _probe(engine) -> dict:
+    """Round-trip time of a trivial query (pool checkout included), or the reason it failed."""
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(_select_one(engine), settings.READINESS_DB_TIMEOUT)
+    except Exception as exc:  # any failure means not ready
+        return {"ok": False, "error": repr(exc)}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Ready when both the primary and read-only databases answer within READINESS_DB_TIMEOUT."""
+    primary, read = await asyncio.gather(_probe(async_engine), _probe(read_engine))
+    ready = primary["ok"] and read["ok"]
+    return JSONResponse(
+        {"status": "ready" if ready else "unavailable", "database": {"primary": primary, "read": read}},
+        status_code=200 if ready else 503
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Request, connection pool and password hashing metrics in the Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
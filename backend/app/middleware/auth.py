@@ -1,6 +1,14 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
 from app.database import get_db
 from app.models.admin import Admin
 from app.utils.security import decode_token
@@ -8,47 +16,127 @@ from app.utils.security import decode_token
 security = HTTPBearer()
 
 
-async def get_current_admin(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> Admin:
+@dataclass(frozen=True)
+class AdminPrincipal:
+    """Authenticated admin, detached from any database session."""
+    id: int
+    username: str
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_admin(cls, admin: Admin) -> "AdminPrincipal":
+        return cls(id=admin.id, username=admin.username, created_at=admin.created_at)
+
+
+class AdminCache:
     """
-    Dependency to get the current authenticated admin.
-    Raises HTTPException if not authenticated.
+    LRU cache from bearer token to AdminPrincipal.
+
+    A hit skips both JWT decoding and the admin lookup. Entries expire at the
+    earlier of the token's `exp` and the TTL, and are dropped as soon as the
+    admin row is updated or deleted (see the mapper events below).
     """
-    token = credentials.credentials
-    payload = decode_token(token)
 
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[AdminPrincipal, float]]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[AdminPrincipal]:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+
+        principal, expires_at = entry
+        if time.time() >= expires_at:
+            del self._entries[token]
+            return None
+
+        self._entries.move_to_end(token)
+        return principal
+
+    def set(self, token: str, principal: AdminPrincipal, token_exp: Optional[float]) -> None:
+        expires_at = time.time() + self.ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+
+        self._entries[token] = (principal, expires_at)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, username: str) -> None:
+        """Drop every cached token belonging to `username`."""
+        for token in [t for t, (p, _) in self._entries.items() if p.username == username]:
+            del self._entries[token]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+admin_cache = AdminCache(ttl=settings.ADMIN_CACHE_TTL)
+
+
+@event.listens_for(Admin, "after_update")
+@event.listens_for(Admin, "after_delete")
+def _invalidate_admin(mapper, connection, target: Admin):
+    """Drop cached principals when an admin row changes, including renames."""
+    usernames = {target.username, *inspect(target).attrs.username.history.deleted}
+    for username in usernames:
+        admin_cache.invalidate(username)
+
+
+async def _resolve_admin(token: str, db: AsyncSession) -> Tuple[Optional[AdminPrincipal], str]:
+    """
+    Resolve a bearer token to an admin principal.
+
+    Returns the principal (or None) and the reason it could not be resolved.
+    """
+    principal = admin_cache.get(token)
+    if principal is not None:
+        return principal, ""
+
+    payload = decode_token(token)
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        return None, "Invalid or expired token"
 
     username: str = payload.get("sub")
     if username is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        return None, "Invalid token payload"
 
-    admin = db.query(Admin).filter(Admin.username == username).first()
+    admin = await db.scalar(select(Admin).where(Admin.username == username))
     if admin is None:
+        return None, "Admin not found"
+
+    principal = AdminPrincipal.from_admin(admin)
+    admin_cache.set(token, principal, payload.get("exp"))
+    return principal, ""
+
+
+async def get_current_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> AdminPrincipal:
+    """
+    Dependency to get the current authenticated admin.
+    Raises HTTPException if not authenticated.
+    """
+    principal, reason = await _resolve_admin(credentials.credentials, db)
+
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Admin not found",
+            detail=reason,
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return admin
+    return principal
 
 
 async def get_optional_admin(
     credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False)),
-    db: Session = Depends(get_db)
-) -> Admin | None:
+    db: AsyncSession = Depends(get_db)
+) -> AdminPrincipal | None:
     """
     Dependency to optionally get the current authenticated admin.
     Returns None if not authenticated.
@@ -56,15 +144,5 @@ async def get_optional_admin(
     if credentials is None:
         return None
 
-    token = credentials.credentials
-    payload = decode_token(token)
-
-    if payload is None:
-        return None
-
-    username: str = payload.get("sub")
-    if username is None:
-        return None
-
-    admin = db.query(Admin).filter(Admin.username == username).first()
-    return admin
+    principal, _ = await _resolve_admin(credentials.credentials, db)
+    return principal
@@ -0,0 +1,61 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import UNMATCHED_ROUTE, RequestMetrics, request_metrics
+
+
+def route_label(scope: Scope) -> str:
+    """
+    Route template of a served request, e.g. "/api/posts/{post_id}".
+
+    Labelling by template rather than URL keeps the number of series bounded.
+    Read after the request: the router records the matched route in the scope.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path_format
+    if scope.get("endpoint") is not None and "app_root_path" in scope:
+        # Matched a mount (e.g. /uploads); root_path now ends with its prefix
+        return scope["root_path"][len(scope["app_root_path"]):] or UNMATCHED_ROUTE
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Records the count, latency, response size and status of every HTTP request.
+
+    A plain ASGI middleware, so streamed bodies are measured to their last
+    chunk and nothing is buffered.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Stays 500 if the app fails before starting a response
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message["type"] == "http.response.zerocopysend":
+                size += message.get("count") or 0
+            await send(message)
+
+        self.metrics.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.in_flight -= 1
+            self.metrics.observe(scope["method"], route_label(scope), status_code, time.perf_counter() - started, size)
@@ -0,0 +1,49 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.metrics import route_label
+from app.utils.metrics import RequestMetrics, request_metrics
+from app.utils.query_profiler import QueryProfile, current_profile
+
+
+class QueryProfilerMiddleware:
+    """
+    Attributes the SQL each request runs to its route.
+
+    Opens a QueryProfile for the request, then records its query count and
+    time per route (exported by /metrics) and warns about statements repeated
+    more than REPEATED_QUERY_THRESHOLD times. With SERVER_TIMING_HEADER on,
+    the database time so far is sent as a `Server-Timing` header.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile(f"{scope['method']} {scope['path']}")
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Queries a streamed body runs after this point are not included
+                MutableHeaders(scope=message).append("Server-Timing", ", ".join([
+                    f'db;dur={profile.duration * 1000:.1f};desc="{profile.count} queries"',
+                    f"app;dur={(time.perf_counter() - started) * 1000:.1f}",
+                ]))
+            await send(message)
+
+        token = current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_timing if settings.SERVER_TIMING_HEADER else send)
+        finally:
+            current_profile.reset(token)
+            profile.warn_repeated()
+            self.metrics.observe_queries(scope["method"], route_label(scope), profile.count, profile.duration)
@@ -0,0 +1,69 @@
+"""
+Versioned schema migrations for existing databases.
+
+`create_all` only creates missing tables, so anything added to an existing
+table (indexes, columns, triggers) is applied here. The schema version is
+stored in SQLite's `PRAGMA user_version`; each migration runs once, in order,
+on the caller's connection. Migrations must be idempotent so they are safe to
+re-run after an interruption and on a database that `create_all` just built
+from the current models.
+"""
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Connection, text
+
+
+def _0001_listing_indexes(conn: Connection) -> None:
+    """Composite indexes matching the listing query shapes."""
+    for statement in (
+        "CREATE INDEX IF NOT EXISTS ix_posts_is_public_created_at ON posts (is_public, created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_posts_created_at ON posts (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_contacts_created_at ON contacts (created_at, id)",
+        'CREATE INDEX IF NOT EXISTS ix_services_is_published_order '
+        'ON services (is_published, "order", created_at DESC, id DESC)',
+        'CREATE INDEX IF NOT EXISTS ix_services_is_published_is_featured_order '
+        'ON services (is_published, is_featured, "order")',
+        'CREATE INDEX IF NOT EXISTS ix_services_order ON services ("order", created_at DESC, id DESC)',
+    ):
+        conn.execute(text(statement))
+    conn.execute(text("ANALYZE"))
+
+
+def _0002_search_index(conn: Connection) -> None:
+    """FTS5 full-text index over posts and services, filled from existing rows."""
+    from app.services.search import create_search_index, rebuild_search_index
+    create_search_index(conn)
+    rebuild_search_index(conn)
+
+
+def _0003_row_versions(conn: Connection) -> None:
+    """Per-row content version for posts and services (used for ETags)."""
+    for table in ("posts", "services"):
+        columns = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+        if "version" not in columns:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+# (version, description, migration) - append only, never renumber
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "composite listing indexes", _0001_listing_indexes),
+    (2, "full-text search index", _0002_search_index),
+    (3, "row versions", _0003_row_versions),
+]
+
+
+def get_schema_version(conn: Connection) -> int:
+    return conn.execute(text("PRAGMA user_version")).scalar_one()
+
+
+def run_migrations(conn: Connection) -> List[int]:
+    """Apply pending migrations and return the versions that were applied."""
+    current = get_schema_version(conn)
+    applied = []
+    for version, _, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+        migrate(conn)
+        conn.execute(text(f"PRAGMA user_version = {int(version)}"))
+        applied.append(version)
+    return applied
@@ -1,5 +1,9 @@
 from app.models.post import Post
 from app.models.contact import Contact
 from app.models.admin import Admin
+from app.models.service import Service
+from app.models.counter import Counter
+from app.models.image_variant import ImageVariant
+from app.models.upload import Upload
 
-__all__ = ["Post", "Contact", "Admin"]
+__all__ = ["Post", "Contact", "Admin", "Service", "Counter", "ImageVariant", "Upload"]
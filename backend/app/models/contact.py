@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Listings: ORDER BY created_at DESC, id DESC
+        Index("ix_contacts_created_at", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -33,3 +37,7 @@ class Contact(Base):
 
     # TODO: Add status management (pending/in_progress/completed)
     # status = Column(Enum('pending', 'in_progress', 'completed'))
+
+
+# Listing order (newest first). id breaks ties so cursor pagination is stable.
+CONTACT_LISTING_ORDER = ((Contact.created_at, True), (Contact.id, True))
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String
+from app.database import Base
+
+
+class Counter(Base):
+    __tablename__ = "counters"
+
+    # Named aggregate, e.g. "total_posts"; maintained by triggers (see app/services/stats.py)
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ImageVariant(Base):
+    """A resized copy of an uploaded image (see app/services/images.py)."""
+    __tablename__ = "image_variants"
+    __table_args__ = (
+        # Lookup by source upload, already in srcset order
+        Index("ix_image_variants_source", "source", "format", "width", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    source = Column(String(255), nullable=False)  # Original upload path relative to UPLOAD_DIR
+    filename = Column(String(255), nullable=False)  # Variant path relative to UPLOAD_DIR
+    format = Column(String(10), nullable=False)  # "avif" / "webp"
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    size = Column(Integer, nullable=False)  # bytes
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
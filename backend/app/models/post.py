@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # Public listing / home: WHERE is_public ORDER BY created_at DESC, id DESC
+        Index("ix_posts_is_public_created_at", "is_public", "created_at", "id"),
+        # Admin listing: ORDER BY created_at DESC, id DESC
+        Index("ix_posts_created_at", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -22,6 +28,8 @@ class Post(Base):
     thumbnail_url = Column(String(500), nullable=True)
     is_public = Column(Boolean, default=True)
     view_count = Column(Integer, default=0)
+    # Bumped by a trigger on every content edit; the ETag source (see app/services/versions.py)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -36,3 +44,7 @@ class Post(Base):
     # TODO: Add SEO metadata
     # meta_description = Column(String(300))
     # slug = Column(String(200), unique=True)
+
+
+# Listing order (newest first). id breaks ties so cursor pagination is stable.
+POST_LISTING_ORDER = ((Post.created_at, True), (Post.id, True))
@@ -1,10 +1,18 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index, desc
 from sqlalchemy.sql import func
 from app.database import Base
 
 
 class Service(Base):
     __tablename__ = "services"
+    __table_args__ = (
+        # Public listing: WHERE is_published ORDER BY order, created_at DESC, id DESC
+        Index("ix_services_is_published_order", "is_published", "order", desc("created_at"), desc("id")),
+        # Featured / home: WHERE is_published AND is_featured ORDER BY order
+        Index("ix_services_is_published_is_featured_order", "is_published", "is_featured", "order"),
+        # Admin listing: ORDER BY order, created_at DESC, id DESC
+        Index("ix_services_order", "order", desc("created_at"), desc("id")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -23,7 +31,13 @@ class Service(Base):
     is_published = Column(Boolean, default=True)
     is_featured = Column(Boolean, default=False)  # For Home page display
     order = Column(Integer, default=0)  # Display order
+    # Bumped by a trigger on every content edit; the ETag source (see app/services/versions.py)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+# Listing order (display order, then newest first). id breaks ties so cursor pagination is stable.
+SERVICE_LISTING_ORDER = ((Service.order, False), (Service.created_at, True), (Service.id, True))
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Upload(Base):
+    """A stored upload, addressed by the SHA-256 of its content (see app/services/uploads.py)."""
+    __tablename__ = "uploads"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    sha256 = Column(String(64), nullable=False, unique=True)
+    path = Column(String(255), nullable=False, unique=True)  # Relative to UPLOAD_DIR, e.g. "ab/cd/abcd...ef.png"
+    mime = Column(String(50), nullable=False)
+    size = Column(Integer, nullable=False)  # bytes
+    refcount = Column(Integer, nullable=False, default=0)  # Posts referencing the file
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
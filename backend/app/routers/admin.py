@@ -1,24 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, select
 from datetime import datetime
-import os
-import uuid
-from pathlib import Path
-from app.database import get_db
-from app.models.post import Post
-from app.models.contact import Contact
-from app.models.admin import Admin
-from app.models.service import Service
+from typing import Optional
+from app.database import get_db, get_pool_stats
+from app.models.post import Post, POST_LISTING_ORDER
+from app.models.contact import Contact, CONTACT_LISTING_ORDER
+from app.models.service import Service, SERVICE_LISTING_ORDER
 from app.schemas.post import PostListResponse, PaginatedPostsResponse
 from app.schemas.contact import ContactDetailResponse, ContactReply, PaginatedContactsResponse
 from app.schemas.service import ServiceListResponse, PaginatedServicesResponse
-from app.middleware.auth import get_current_admin
-from app.utils.pagination import paginate
-from app.config import get_settings
-
-settings = get_settings()
+from app.middleware.auth import get_current_admin, AdminPrincipal
+from app.utils.pagination import paginate, CountMode
+from app.schemas.bulk import BulkResult, ContactBulkRequest, PostBulkRequest, ServiceBulkRequest
+from app.schemas.transfer import TransferResource, ImportResult
+from app.services.stats import get_dashboard_counters
+from app.services.bulk import bulk_posts, bulk_services, bulk_contacts
+from app.services.transfer import NDJSONImporter, export_ndjson
+from app.services.uploads import StreamingUpload, store_upload
+from app.services.images import create_variants, get_variants, MIME_TYPES
+from app.utils.hashing import hashing_executor
+from app.utils.invalidation import invalidate
 
 router = APIRouter()
 
@@ -27,61 +30,65 @@ router = APIRouter()
 
 @router.get("/dashboard")
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Get dashboard statistics.
+    Counts come from the trigger-maintained counters table.
     """
-    total_posts = db.query(Post).count()
-    public_posts = db.query(Post).filter(Post.is_public == True).count()
-    total_contacts = db.query(Contact).count()
-    unread_contacts = db.query(Contact).filter(Contact.is_read == False).count()
-    unreplied_contacts = db.query(Contact).filter(Contact.admin_reply == None).count()
-    total_services = db.query(Service).count()
-    published_services = db.query(Service).filter(Service.is_published == True).count()
-    featured_services = db.query(Service).filter(Service.is_featured == True).count()
-
-    recent_posts = db.query(Post).order_by(desc(Post.created_at)).limit(5).all()
-    recent_contacts = db.query(Contact).order_by(desc(Contact.created_at)).limit(5).all()
+    stats = await get_dashboard_counters(db)
+
+    recent_posts = (await db.scalars(select(Post).order_by(desc(Post.created_at)).limit(5))).all()
+    recent_contacts = (await db.scalars(select(Contact).order_by(desc(Contact.created_at)).limit(5))).all()
 
     return {
-        "stats": {
-            "total_posts": total_posts,
-            "public_posts": public_posts,
-            "total_contacts": total_contacts,
-            "unread_contacts": unread_contacts,
-            "unreplied_contacts": unreplied_contacts,
-            "total_services": total_services,
-            "published_services": published_services,
-            "featured_services": featured_services
-        },
+        "stats": stats,
         "recent_posts": [PostListResponse.model_validate(p) for p in recent_posts],
         "recent_contacts": [ContactDetailResponse.model_validate(c) for c in recent_contacts]
     }
 
 
+@router.get("/system")
+async def get_system_stats(
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+):
+    """
+    Get runtime statistics (password hashing queue and latency, database
+    connection pool checkouts and waits).
+    """
+    return {
+        "hashing": hashing_executor.stats(),
+        "database_pools": get_pool_stats()
+    }
+
+
 # ============ Posts Management ============
 
 @router.get("/posts", response_model=PaginatedPostsResponse)
 async def get_all_posts(
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    count: CountMode = "exact",
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Get all posts including private ones. Admin only.
     """
-    query = db.query(Post).order_by(desc(Post.created_at))
-    result = paginate(query, page, limit)
+    query = select(Post)
+    result = await paginate(db, query, page, limit, keyset=POST_LISTING_ORDER, after=after, before=before, count=count)
 
     return PaginatedPostsResponse(
         items=[PostListResponse.model_validate(p) for p in result["items"]],
         total=result["total"],
         page=result["page"],
         limit=result["limit"],
-        total_pages=result["total_pages"]
+        total_pages=result["total_pages"],
+        next_cursor=result["next_cursor"],
+        prev_cursor=result["prev_cursor"]
     )
 
 
@@ -91,21 +98,26 @@ async def get_all_posts(
 async def get_all_services(
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    count: CountMode = "exact",
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Get all services including unpublished. Admin only.
     """
-    query = db.query(Service).order_by(Service.order, desc(Service.created_at))
-    result = paginate(query, page, limit)
+    query = select(Service)
+    result = await paginate(db, query, page, limit, keyset=SERVICE_LISTING_ORDER, after=after, before=before, count=count)
 
     return PaginatedServicesResponse(
         items=[ServiceListResponse.model_validate(s) for s in result["items"]],
         total=result["total"],
         page=result["page"],
         limit=result["limit"],
-        total_pages=result["total_pages"]
+        total_pages=result["total_pages"],
+        next_cursor=result["next_cursor"],
+        prev_cursor=result["prev_cursor"]
     )
 
 
@@ -132,35 +144,40 @@ def admin_contact_to_response(contact: Contact) -> dict:
 async def get_all_contacts(
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    count: CountMode = "exact",
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Get all contacts with full details. Admin only.
     """
-    query = db.query(Contact).order_by(desc(Contact.created_at))
-    result = paginate(query, page, limit)
+    query = select(Contact)
+    result = await paginate(db, query, page, limit, keyset=CONTACT_LISTING_ORDER, after=after, before=before, count=count)
 
     return {
         "items": [admin_contact_to_response(c) for c in result["items"]],
         "total": result["total"],
         "page": result["page"],
         "limit": result["limit"],
-        "total_pages": result["total_pages"]
+        "total_pages": result["total_pages"],
+        "next_cursor": result["next_cursor"],
+        "prev_cursor": result["prev_cursor"]
     }
 
 
 @router.get("/contacts/{contact_id}", response_model=ContactDetailResponse)
 async def get_contact_detail(
     contact_id: int,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Get full contact details. Admin only.
     Marks contact as read.
     """
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+    contact = await db.scalar(select(Contact).where(Contact.id == contact_id))
 
     if not contact:
         raise HTTPException(
@@ -171,8 +188,9 @@ async def get_contact_detail(
     # Mark as read
     if not contact.is_read:
         contact.is_read = True
-        db.commit()
-        db.refresh(contact)
+        await db.commit()
+        invalidate(Contact.__tablename__)
+        await db.refresh(contact)
 
     return contact
 
@@ -181,13 +199,13 @@ async def get_contact_detail(
 async def reply_to_contact(
     contact_id: int,
     reply_data: ContactReply,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Add admin reply to a contact. Admin only.
     """
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+    contact = await db.scalar(select(Contact).where(Contact.id == contact_id))
 
     if not contact:
         raise HTTPException(
@@ -200,8 +218,9 @@ async def reply_to_contact(
     contact.replied_at = datetime.utcnow()
     contact.is_read = True
 
-    db.commit()
-    db.refresh(contact)
+    await db.commit()
+    invalidate(Contact.__tablename__)
+    await db.refresh(contact)
 
     return contact
 
@@ -209,13 +228,13 @@ async def reply_to_contact(
 @router.delete("/contacts/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contact(
     contact_id: int,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Delete a contact. Admin only.
     """
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+    contact = await db.scalar(select(Contact).where(Contact.id == contact_id))
 
     if not contact:
         raise HTTPException(
@@ -223,50 +242,150 @@ async def delete_contact(
             detail="Contact not found"
         )
 
-    db.delete(contact)
-    db.commit()
+    await db.delete(contact)
+    await db.commit()
+    invalidate(Contact.__tablename__)
     return None
 
 
+# ============ Bulk Operations ============
+#
+# Each request selects rows by `ids`, `filter` or both (AND-ed) and applies
+# one action with a single UPDATE/DELETE statement, in one transaction.
+
+@router.post("/bulk/posts", response_model=BulkResult)
+async def bulk_update_posts(
+    bulk: PostBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+):
+    """
+    Delete, publish or unpublish many posts at once. Admin only.
+    Returns the number of posts affected.
+    """
+    return BulkResult(action=bulk.action, affected=await bulk_posts(db, bulk))
+
+
+@router.post("/bulk/services", response_model=BulkResult)
+async def bulk_update_services(
+    bulk: ServiceBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+):
+    """
+    Delete, publish/unpublish or feature/unfeature many services at once. Admin only.
+    Returns the number of services affected.
+    """
+    return BulkResult(action=bulk.action, affected=await bulk_services(db, bulk))
+
+
+@router.post("/bulk/contacts", response_model=BulkResult)
+async def bulk_update_contacts(
+    bulk: ContactBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+):
+    """
+    Delete or mark as read/unread many contacts at once (e.g. clearing spam). Admin only.
+    Returns the number of contacts affected.
+    """
+    return BulkResult(action=bulk.action, affected=await bulk_contacts(db, bulk))
+
+
+# ============ Export / Import ============
+
+@router.get("/export/{resource}", response_class=StreamingResponse, responses={
+    200: {"content": {"application/x-ndjson": {}}, "description": "One JSON object per line"}
+})
+async def export_resource(
+    resource: TransferResource,
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+):
+    """
+    Download every post, service or contact as NDJSON (one row per line,
+    in id order). Admin only.
+    The export is streamed from a database cursor, so it starts at once and
+    does not hold the table in memory. Contacts include the password hash
+    of secret inquiries, so an import keeps them verifiable.
+    """
+    return StreamingResponse(
+        export_ndjson(resource),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{resource}.ndjson"'}
+    )
+
+
+@router.post("/import/{resource}", response_model=ImportResult, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {"application/x-ndjson": {"schema": {"type": "string", "format": "binary"}}}
+    }
+})
+async def import_resource(
+    resource: TransferResource,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+):
+    """
+    Insert posts, services or contacts from an NDJSON body, in the format
+    the export writes. Admin only.
+    The body is read as it streams in and inserted in batches, each
+    committed on its own; `id` and `created_at` may be omitted. Lines that
+    fail validation or insertion are skipped and listed with their line
+    numbers in `errors`.
+    """
+    return await NDJSONImporter(db, resource).run(request.stream())
+
+
 # ============ File Upload ============
 
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 ALLOWED_FILE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".pdf", ".doc", ".docx"}
 
 
-@router.post("/upload")
+@router.post("/upload", openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {"multipart/form-data": {"schema": {
+            "type": "object",
+            "required": ["file"],
+            "properties": {"file": {"type": "string", "format": "binary"}}
+        }}}
+    }
+})
 async def upload_file(
-    file: UploadFile = File(...),
-    current_admin: Admin = Depends(get_current_admin)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Upload a file. Admin only.
     Returns the URL to access the uploaded file.
-    """
-    # Validate file extension
-    file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in ALLOWED_IMAGE_EXTENSIONS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_IMAGE_EXTENSIONS)}"
-        )
 
-    # Validate file size
-    contents = await file.read()
-    if len(contents) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size exceeds maximum allowed size ({settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB)"
-        )
-
-    # Generate unique filename
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = Path(settings.UPLOAD_DIR) / unique_filename
+    The body is streamed to disk as it arrives: oversized uploads (413) and
+    files whose content does not match their extension (400) are rejected
+    before the rest of the body is read. Resized AVIF/WebP variants are
+    generated before responding, so posts using the image list them in
+    `thumbnail_srcset`. Files are stored under their SHA-256, so the URL is
+    immutable and uploading the same content again returns the same URL.
+    """
+    upload = await StreamingUpload(request, "file", ALLOWED_IMAGE_EXTENSIONS).receive()
 
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Stored under its content hash; a duplicate reuses the existing file and variants
+    record, created = await store_upload(db, upload)
+    if created:
+        variants = await create_variants(db, record.path)
+    else:
+        variants = await get_variants(db, record.path)
 
     # Return URL
-    file_url = f"/uploads/{unique_filename}"
-    return JSONResponse(content={"url": file_url, "filename": unique_filename})
+    file_url = f"/uploads/{record.path}"
+    return JSONResponse(content={
+        "url": file_url,
+        "filename": record.path,
+        "variants": [
+            {"url": f"/uploads/{v.filename}", "type": MIME_TYPES[v.format], "width": v.width, "height": v.height}
+            for v in variants
+        ]
+    })
@@ -1,22 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.admin import Admin
 from app.schemas.admin import AdminLogin, Token, AdminResponse
-from app.utils.security import verify_password, create_access_token
-from app.middleware.auth import get_current_admin
+from app.utils.security import create_access_token
+from app.utils.hashing import hashing_executor
+from app.middleware.auth import get_current_admin, AdminPrincipal
 
 router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-async def login(login_data: AdminLogin, db: Session = Depends(get_db)):
+async def login(login_data: AdminLogin, db: AsyncSession = Depends(get_db)):
     """
     Authenticate admin and return JWT token.
     """
-    admin = db.query(Admin).filter(Admin.username == login_data.username).first()
+    admin = await db.scalar(select(Admin).where(Admin.username == login_data.username))
 
-    if not admin or not verify_password(login_data.password, admin.hashed_password):
+    if not admin or not await hashing_executor.verify(login_data.password, admin.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
@@ -34,7 +36,7 @@ async def login(login_data: AdminLogin, db: Session = Depends(get_db)):
 
 @router.get("/me", response_model=AdminResponse)
 async def get_current_admin_info(
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Get current authenticated admin info.
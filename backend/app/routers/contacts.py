@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from datetime import datetime
-from app.database import get_db
-from app.models.contact import Contact
-from app.models.admin import Admin
+from typing import Optional
+from app.database import get_db, get_read_db
+from app.models.contact import Contact, CONTACT_LISTING_ORDER
 from app.schemas.contact import (
     ContactCreate,
     ContactResponse,
@@ -12,9 +12,11 @@ from app.schemas.contact import (
     ContactVerify,
     PaginatedContactsResponse
 )
-from app.middleware.auth import get_optional_admin
-from app.utils.security import get_password_hash, verify_password
-from app.utils.pagination import paginate
+from app.middleware.auth import get_optional_admin, AdminPrincipal
+from app.utils.hashing import hashing_executor
+from app.utils.pagination import paginate, CountMode
+from app.utils.invalidation import invalidate
+from app.utils.response_cache import response_cache
 
 router = APIRouter()
 
@@ -34,35 +36,47 @@ def contact_to_response(contact: Contact) -> ContactResponse:
 async def get_contacts(
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    count: CountMode = "exact",
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of contacts with pagination.
     Secret contacts show masked name.
+    Pass `after`/`before` cursors for keyset pagination instead of `page`,
+    and `count=estimate|none` to skip the exact total count.
     """
-    query = db.query(Contact).order_by(desc(Contact.created_at))
-    result = paginate(query, page, limit)
+    cache_key = ("contacts", page, limit, after, before, count)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    return PaginatedContactsResponse(
+    query = select(Contact)
+    result = await paginate(db, query, page, limit, keyset=CONTACT_LISTING_ORDER, after=after, before=before, count=count)
+
+    return response_cache.store(cache_key, PaginatedContactsResponse(
         items=[contact_to_response(c) for c in result["items"]],
         total=result["total"],
         page=result["page"],
         limit=result["limit"],
-        total_pages=result["total_pages"]
-    )
+        total_pages=result["total_pages"],
+        next_cursor=result["next_cursor"],
+        prev_cursor=result["prev_cursor"]
+    ), tags=(Contact.__tablename__,))
 
 
 @router.get("/{contact_id}", response_model=ContactDetailResponse)
 async def get_contact(
     contact_id: int,
-    db: Session = Depends(get_db),
-    current_admin: Admin | None = Depends(get_optional_admin)
+    db: AsyncSession = Depends(get_read_db),
+    current_admin: AdminPrincipal | None = Depends(get_optional_admin)
 ):
     """
     Get a single contact by ID.
     If secret, requires admin auth or password verification.
     """
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+    contact = await db.scalar(select(Contact).where(Contact.id == contact_id))
 
     if not contact:
         raise HTTPException(
@@ -83,7 +97,7 @@ async def get_contact(
 @router.post("", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     contact_data: ContactCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new contact inquiry.
@@ -92,14 +106,15 @@ async def create_contact(
 
     # Hash secret password if provided
     if contact_data.is_secret and contact_data.secret_password:
-        contact_dict["secret_password"] = get_password_hash(contact_data.secret_password)
+        contact_dict["secret_password"] = await hashing_executor.hash(contact_data.secret_password)
     else:
         contact_dict["secret_password"] = None
 
     contact = Contact(**contact_dict)
     db.add(contact)
-    db.commit()
-    db.refresh(contact)
+    await db.commit()
+    invalidate(Contact.__tablename__)
+    await db.refresh(contact)
 
     return contact_to_response(contact)
 
@@ -108,13 +123,13 @@ async def create_contact(
 async def verify_contact_password(
     contact_id: int,
     verify_data: ContactVerify,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Verify password for a secret contact.
     Returns full contact details if password is correct.
     """
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+    contact = await db.scalar(select(Contact).where(Contact.id == contact_id))
 
     if not contact:
         raise HTTPException(
@@ -131,7 +146,7 @@ async def verify_contact_password(
             detail="This contact has no password set"
         )
 
-    if not verify_password(verify_data.password, contact.secret_password):
+    if not await hashing_executor.verify(verify_data.password, contact.secret_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password"
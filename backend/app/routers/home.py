@@ -1,32 +1,68 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.database import get_db
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, select
+from app.database import get_read_db
 from app.models.service import Service
 from app.models.post import Post
 from app.schemas.service import ServiceListResponse
 from app.schemas.post import PostListResponse
+from app.utils.response_cache import response_cache
+from app.utils.conditional import validators, not_modified
+from app.services.versions import get_table_versions
+from app.services.images import attach_srcsets
+from app.utils.serialization import ResponseEncoder, model_columns, rows_to_dicts
 
 router = APIRouter()
 
+SERVICE_COLUMNS = model_columns(Service, ServiceListResponse)
+POST_COLUMNS = model_columns(Post, PostListResponse)
+
+
+class HomeData(BaseModel):
+    """Shape of the home payload, encoded straight from column values."""
+    featured_services: List[ServiceListResponse]
+    latest_posts: List[PostListResponse]
+
+
+home_encoder = ResponseEncoder(HomeData)
+
 
 @router.get("")
-async def get_home_data(db: Session = Depends(get_db)):
+async def get_home_data(request: Request, db: AsyncSession = Depends(get_read_db)):
     """
     Get data for home page: featured services + latest posts.
+    Served from the response cache until a post or service changes, and
+    revalidated against the posts and services table versions.
     """
+    cache_key = ("home",)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return not_modified(request, cached.headers) or cached
+
+    versions = await get_table_versions(db, Service.__tablename__, Post.__tablename__)
+    headers = validators(
+        *cache_key,
+        *[version for version, _ in versions.values()],
+        last_modified=max(modified for _, modified in versions.values())
+    )
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+
     # Featured services (up to 4)
-    featured_services = db.query(Service).filter(
+    featured_services = (await db.execute(select(*SERVICE_COLUMNS).where(
         Service.is_published == True,
         Service.is_featured == True
-    ).order_by(Service.order).limit(4).all()
+    ).order_by(Service.order).limit(4))).all()
 
     # Latest public posts (up to 5)
-    latest_posts = db.query(Post).filter(
+    latest_posts = (await db.execute(select(*POST_COLUMNS).where(
         Post.is_public == True
-    ).order_by(desc(Post.created_at)).limit(5).all()
+    ).order_by(desc(Post.created_at)).limit(5))).all()
 
-    return {
-        "featured_services": [ServiceListResponse.model_validate(s) for s in featured_services],
-        "latest_posts": [PostListResponse.model_validate(p) for p in latest_posts]
-    }
+    return response_cache.store(cache_key, home_encoder.encode({
+        "featured_services": rows_to_dicts(featured_services, SERVICE_COLUMNS),
+        "latest_posts": await attach_srcsets(db, rows_to_dicts(latest_posts, POST_COLUMNS, thumbnail_srcset=None))
+    }), tags=(Service.__tablename__, Post.__tablename__), headers=headers)
@@ -1,52 +1,116 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.database import get_db
-from app.models.post import Post
-from app.models.admin import Admin
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from typing import Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.database import get_db, get_read_db
+from app.models.post import Post, POST_LISTING_ORDER
 from app.schemas.post import (
     PostCreate,
     PostUpdate,
     PostResponse,
     PostListResponse,
+    PostLocalizedResponse,
     PaginatedPostsResponse
 )
-from app.middleware.auth import get_current_admin
-from app.utils.pagination import paginate
+from app.schemas.common import Language
+from app.middleware.auth import get_current_admin, AdminPrincipal
+from app.utils.pagination import paginate, CountMode
+from app.utils.localization import localized
+from app.utils.invalidation import invalidate
+from app.utils.response_cache import response_cache
+from app.utils.conditional import validators, not_modified, is_conditional
+from app.services.versions import get_table_versions
+from app.services.view_counter import view_counter
+from app.services.images import attach_srcsets
+from app.utils.serialization import ResponseEncoder, model_columns, rows_to_dicts
 
 router = APIRouter()
 
+# List pages are read as plain column tuples and encoded without building models
+LIST_COLUMNS = model_columns(Post, PostListResponse)
+page_encoder = ResponseEncoder(PaginatedPostsResponse)
+
+
+def _post_validators(post_id: int, lang: Optional[str], row):
+    return validators("post", post_id, row.version, lang, last_modified=row.updated_at or row.created_at)
+
 
 @router.get("", response_model=PaginatedPostsResponse)
 async def get_posts(
+    request: Request,
     page: int = 1,
     limit: int = 9,
-    db: Session = Depends(get_db)
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    count: CountMode = "exact",
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of public posts with pagination.
+    Pass `after`/`before` cursors for keyset pagination instead of `page`,
+    and `count=estimate|none` to skip the exact total count.
+    Supports If-None-Match / If-Modified-Since against the posts table version.
     """
-    query = db.query(Post).filter(Post.is_public == True).order_by(desc(Post.created_at))
-    result = paginate(query, page, limit)
+    cache_key = ("posts", page, limit, after, before, count)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return not_modified(request, cached.headers) or cached
+
+    version, modified = (await get_table_versions(db, Post.__tablename__))[Post.__tablename__]
+    headers = validators(*cache_key, version, last_modified=modified)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
 
-    return PaginatedPostsResponse(
-        items=[PostListResponse.model_validate(p) for p in result["items"]],
-        total=result["total"],
-        page=result["page"],
-        limit=result["limit"],
-        total_pages=result["total_pages"]
-    )
+    query = select(*LIST_COLUMNS).where(Post.is_public == True)
+    result = await paginate(db, query, page, limit, keyset=POST_LISTING_ORDER, after=after, before=before, count=count)
+    result["items"] = await attach_srcsets(db, rows_to_dicts(result["items"], LIST_COLUMNS, thumbnail_srcset=None))
 
+    return response_cache.store(cache_key, page_encoder.encode(result), tags=(Post.__tablename__,), headers=headers)
 
-@router.get("/{post_id}", response_model=PostResponse)
+
+@router.get("/{post_id}", response_model=Union[PostResponse, PostLocalizedResponse])
 async def get_post(
     post_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    lang: Optional[Language] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a single post by ID. Only public posts are accessible.
+    With `lang`, only that language's title/content are loaded and returned
+    (falling back to Korean where a translation is missing).
+
+    The ETag tracks the post's content version, not its view count, so a
+    revalidated copy keeps the view count it was fetched with. A 304 still
+    counts as a view.
     """
-    post = db.query(Post).filter(Post.id == post_id, Post.is_public == True).first()
+    if is_conditional(request):
+        row = (await db.execute(select(Post.version, Post.updated_at, Post.created_at).where(
+            Post.id == post_id,
+            Post.is_public == True
+        ))).first()
+        if row is not None:
+            unchanged = not_modified(request, _post_validators(post_id, lang, row))
+            if unchanged is not None:
+                view_counter.increment(post_id)
+                return unchanged
+
+    if lang is None:
+        post = await db.scalar(select(Post).where(Post.id == post_id, Post.is_public == True))
+    else:
+        post = (await db.execute(select(
+            Post.id,
+            localized(Post, "title", lang),
+            localized(Post, "content", lang),
+            Post.thumbnail_url,
+            Post.is_public,
+            Post.view_count,
+            Post.version,
+            Post.created_at,
+            Post.updated_at
+        ).where(Post.id == post_id, Post.is_public == True))).first()
 
     if not post:
         raise HTTPException(
@@ -54,27 +118,33 @@ async def get_post(
             detail="Post not found"
         )
 
-    # Increment view count
-    post.view_count += 1
-    db.commit()
-    db.refresh(post)
+    # Buffer the view; it is written back in batches by the view counter
+    view_counter.increment(post.id)
+    response.headers.update(_post_validators(post.id, lang, post))
+
+    if lang is None:
+        result = PostResponse.model_validate(post)
+    else:
+        result = PostLocalizedResponse(lang=lang, **post._mapping)
+    result.view_count += view_counter.pending(post.id)
+    return result
 
-    return post
 
 
 @router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     post_data: PostCreate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Create a new post. Admin only.
     """
     post = Post(**post_data.model_dump())
     db.add(post)
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    invalidate(Post.__tablename__)
+    await db.refresh(post)
     return post
 
 
@@ -82,13 +152,13 @@ async def create_post(
 async def update_post(
     post_id: int,
     post_data: PostUpdate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Update an existing post. Admin only.
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.scalar(select(Post).where(Post.id == post_id))
 
     if not post:
         raise HTTPException(
@@ -100,21 +170,22 @@ async def update_post(
     for key, value in update_data.items():
         setattr(post, key, value)
 
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    invalidate(Post.__tablename__)
+    await db.refresh(post)
     return post
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: int,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Delete a post. Admin only.
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.scalar(select(Post).where(Post.id == post_id))
 
     if not post:
         raise HTTPException(
@@ -122,6 +193,7 @@ async def delete_post(
             detail="Post not found"
         )
 
-    db.delete(post)
-    db.commit()
+    await db.delete(post)
+    await db.commit()
+    invalidate(Post.__tablename__)
     return None
@@ -0,0 +1,98 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text
+from typing import Literal, Optional
+from app.database import get_read_db
+from app.models.post import Post
+from app.models.service import Service
+from app.schemas.common import Language
+from app.schemas.search import SearchResult, SearchResponse
+from app.services.search import (
+    SEARCH_TABLE,
+    KIND_CODES,
+    build_match_query,
+    search_terms,
+    split_rowid,
+    best_snippet
+)
+from app.utils.pagination import encode_cursor, decode_cursor
+
+router = APIRouter()
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str,
+    kind: Optional[Literal["post", "service"]] = None,
+    lang: Optional[Language] = None,
+    limit: int = 10,
+    after: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Full-text search over public posts and published services.
+    Results are ranked by BM25 (titles weigh more than bodies); `lang` picks
+    the language snippets are taken from first. Pass `next_cursor` back as
+    `after` for the next page.
+    """
+    limit = min(50, max(1, limit))
+    match = build_match_query(q)
+    if match is None:
+        return SearchResponse(items=[], limit=limit)
+
+    conditions = [f"{SEARCH_TABLE} MATCH :match"]
+    params = {"match": match, "limit": limit + 1}
+    if kind is not None:
+        conditions.append("rowid % 2 = :kind")
+        params["kind"] = KIND_CODES[kind]
+    if after:
+        rank, rowid = decode_cursor(after, 2)
+        conditions.append("(rank > :rank OR (rank = :rank AND rowid > :rowid))")
+        params.update(rank=rank, rowid=rowid)
+
+    hits = (await db.execute(text(
+        f"SELECT rowid, rank FROM {SEARCH_TABLE} WHERE {' AND '.join(conditions)} "
+        f"ORDER BY rank, rowid LIMIT :limit"
+    ), params)).all()
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor(hits[-1])
+
+    # Load the matched rows (visibility is re-checked in case the index lags)
+    ids = {"post": [], "service": []}
+    for rowid, _ in hits:
+        hit_kind, ref_id = split_rowid(rowid)
+        ids[hit_kind].append(ref_id)
+
+    rows = {}
+    if ids["post"]:
+        for post in (await db.scalars(select(Post).where(Post.id.in_(ids["post"]), Post.is_public == True))).all():
+            rows[("post", post.id)] = (post, "content")
+    if ids["service"]:
+        for service in (await db.scalars(select(Service).where(
+            Service.id.in_(ids["service"]),
+            Service.is_published == True
+        ))).all():
+            rows[("service", service.id)] = (service, "description")
+
+    terms = search_terms(q)
+    items = []
+    for rowid, rank in hits:
+        hit_kind, ref_id = split_rowid(rowid)
+        if (hit_kind, ref_id) not in rows:
+            continue
+        row, field = rows[(hit_kind, ref_id)]
+        texts = {code: getattr(row, f"{field}_{code}") for code in ("ko", "en", "zh")}
+        items.append(SearchResult(
+            kind=hit_kind,
+            id=ref_id,
+            title_ko=row.title_ko,
+            title_en=row.title_en,
+            title_zh=row.title_zh,
+            snippet=best_snippet(texts, terms, lang),
+            score=rank
+        ))
+
+    return SearchResponse(items=items, limit=limit, next_cursor=next_cursor)
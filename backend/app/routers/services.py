@@ -1,74 +1,155 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import List
-from app.database import get_db
-from app.models.service import Service
-from app.models.admin import Admin
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional, Union
+from app.database import get_db, get_read_db
+from app.models.service import Service, SERVICE_LISTING_ORDER
 from app.schemas.service import (
     ServiceCreate,
     ServiceUpdate,
     ServiceResponse,
     ServiceListResponse,
+    ServiceLocalizedResponse,
     PaginatedServicesResponse
 )
-from app.middleware.auth import get_current_admin
-from app.utils.pagination import paginate
+from app.schemas.common import Language
+from app.middleware.auth import get_current_admin, AdminPrincipal
+from app.utils.pagination import paginate, CountMode
+from app.utils.localization import localized
+from app.utils.invalidation import invalidate
+from app.utils.response_cache import response_cache
+from app.utils.conditional import validators, not_modified, is_conditional
+from app.services.versions import get_table_versions
+from app.utils.serialization import ResponseEncoder, model_columns, rows_to_dicts
 
 router = APIRouter()
 
+# List pages are read as plain column tuples and encoded without building models
+LIST_COLUMNS = model_columns(Service, ServiceListResponse)
+page_encoder = ResponseEncoder(PaginatedServicesResponse)
+list_encoder = ResponseEncoder(List[ServiceListResponse])
+
+
+def _service_validators(service_id: int, lang: Optional[str], row):
+    return validators("service", service_id, row.version, lang, last_modified=row.updated_at or row.created_at)
+
+
+async def _services_validators(db: AsyncSession, cache_key):
+    version, modified = (await get_table_versions(db, Service.__tablename__))[Service.__tablename__]
+    return validators(*cache_key, version, last_modified=modified)
+
 
 @router.get("", response_model=PaginatedServicesResponse)
 async def get_services(
+    request: Request,
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    count: CountMode = "exact",
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get list of published services with pagination.
+    Pass `after`/`before` cursors for keyset pagination instead of `page`,
+    and `count=estimate|none` to skip the exact total count.
+    Supports If-None-Match / If-Modified-Since against the services table version.
     """
-    query = db.query(Service).filter(
-        Service.is_published == True
-    ).order_by(Service.order, desc(Service.created_at))
-    result = paginate(query, page, limit)
-
-    return PaginatedServicesResponse(
-        items=[ServiceListResponse.model_validate(s) for s in result["items"]],
-        total=result["total"],
-        page=result["page"],
-        limit=result["limit"],
-        total_pages=result["total_pages"]
-    )
+    cache_key = ("services", page, limit, after, before, count)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return not_modified(request, cached.headers) or cached
+
+    headers = await _services_validators(db, cache_key)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+
+    query = select(*LIST_COLUMNS).where(Service.is_published == True)
+    result = await paginate(db, query, page, limit, keyset=SERVICE_LISTING_ORDER, after=after, before=before, count=count)
+    result["items"] = rows_to_dicts(result["items"], LIST_COLUMNS)
+
+    return response_cache.store(cache_key, page_encoder.encode(result), tags=(Service.__tablename__,), headers=headers)
 
 
 @router.get("/featured", response_model=List[ServiceListResponse])
 async def get_featured_services(
+    request: Request,
     limit: int = 4,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get featured services for home page.
     """
-    services = db.query(Service).filter(
+    cache_key = ("services:featured", limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return not_modified(request, cached.headers) or cached
+
+    headers = await _services_validators(db, cache_key)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+
+    services = (await db.execute(select(*LIST_COLUMNS).where(
         Service.is_published == True,
         Service.is_featured == True
-    ).order_by(Service.order).limit(limit).all()
+    ).order_by(Service.order).limit(limit))).all()
 
-    return [ServiceListResponse.model_validate(s) for s in services]
+    return response_cache.store(
+        cache_key,
+        list_encoder.encode(rows_to_dicts(services, LIST_COLUMNS)),
+        tags=(Service.__tablename__,),
+        headers=headers
+    )
 
 
-@router.get("/{service_id}", response_model=ServiceResponse)
+@router.get("/{service_id}", response_model=Union[ServiceResponse, ServiceLocalizedResponse])
 async def get_service(
     service_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    lang: Optional[Language] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a single service by ID.
+    With `lang`, only that language's title/description are loaded and returned
+    (falling back to Korean where a translation is missing).
+    Supports If-None-Match / If-Modified-Since against the service's version.
     """
-    service = db.query(Service).filter(
-        Service.id == service_id,
-        Service.is_published == True
-    ).first()
+    cache_key = ("service", service_id, lang)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return not_modified(request, cached.headers) or cached
+
+    if is_conditional(request):
+        row = (await db.execute(select(Service.version, Service.updated_at, Service.created_at).where(
+            Service.id == service_id,
+            Service.is_published == True
+        ))).first()
+        if row is not None:
+            unchanged = not_modified(request, _service_validators(service_id, lang, row))
+            if unchanged is not None:
+                return unchanged
+
+    if lang is None:
+        service = await db.scalar(select(Service).where(
+            Service.id == service_id,
+            Service.is_published == True
+        ))
+    else:
+        service = (await db.execute(select(
+            Service.id,
+            localized(Service, "title", lang),
+            localized(Service, "description", lang),
+            Service.icon,
+            Service.is_published,
+            Service.is_featured,
+            Service.order,
+            Service.version,
+            Service.created_at,
+            Service.updated_at
+        ).where(Service.id == service_id, Service.is_published == True))).first()
 
     if not service:
         raise HTTPException(
@@ -76,22 +157,32 @@ async def get_service(
             detail="Service not found"
         )
 
-    return service
+    if lang is None:
+        response = ServiceResponse.model_validate(service)
+    else:
+        response = ServiceLocalizedResponse(lang=lang, **service._mapping)
+    return response_cache.store(
+        cache_key,
+        response,
+        tags=(Service.__tablename__,),
+        headers=_service_validators(service.id, lang, service)
+    )
 
 
 @router.post("", response_model=ServiceResponse, status_code=status.HTTP_201_CREATED)
 async def create_service(
     service_data: ServiceCreate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Create a new service. Admin only.
     """
     service = Service(**service_data.model_dump())
     db.add(service)
-    db.commit()
-    db.refresh(service)
+    await db.commit()
+    invalidate(Service.__tablename__)
+    await db.refresh(service)
     return service
 
 
@@ -99,13 +190,13 @@ async def create_service(
 async def update_service(
     service_id: int,
     service_data: ServiceUpdate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Update an existing service. Admin only.
     """
-    service = db.query(Service).filter(Service.id == service_id).first()
+    service = await db.scalar(select(Service).where(Service.id == service_id))
 
     if not service:
         raise HTTPException(
@@ -117,21 +208,22 @@ async def update_service(
     for key, value in update_data.items():
         setattr(service, key, value)
 
-    db.commit()
-    db.refresh(service)
+    await db.commit()
+    invalidate(Service.__tablename__)
+    await db.refresh(service)
     return service
 
 
 @router.delete("/{service_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_service(
     service_id: int,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
     """
     Delete a service. Admin only.
     """
-    service = db.query(Service).filter(Service.id == service_id).first()
+    service = await db.scalar(select(Service).where(Service.id == service_id))
 
     if not service:
         raise HTTPException(
@@ -139,6 +231,7 @@ async def delete_service(
             detail="Service not found"
         )
 
-    db.delete(service)
-    db.commit()
+    await db.delete(service)
+    await db.commit()
+    invalidate(Service.__tablename__)
     return None
@@ -3,6 +3,7 @@ from app.schemas.post import (
     PostUpdate,
     PostResponse,
     PostListResponse,
+    PostLocalizedResponse,
     PaginatedPostsResponse
 )
 from app.schemas.contact import (
@@ -13,6 +14,14 @@ from app.schemas.contact import (
     ContactReply,
     PaginatedContactsResponse
 )
+from app.schemas.service import (
+    ServiceCreate,
+    ServiceUpdate,
+    ServiceResponse,
+    ServiceListResponse,
+    ServiceLocalizedResponse,
+    PaginatedServicesResponse
+)
 from app.schemas.admin import (
     AdminCreate,
     AdminLogin,
@@ -22,7 +31,10 @@ from app.schemas.admin import (
 )
 
 __all__ = [
-    "PostCreate", "PostUpdate", "PostResponse", "PostListResponse", "PaginatedPostsResponse",
+    "PostCreate", "PostUpdate", "PostResponse", "PostListResponse", "PostLocalizedResponse",
+    "PaginatedPostsResponse",
+    "ServiceCreate", "ServiceUpdate", "ServiceResponse", "ServiceListResponse",
+    "ServiceLocalizedResponse", "PaginatedServicesResponse",
     "ContactCreate", "ContactResponse", "ContactDetailResponse", "ContactVerify",
     "ContactReply", "PaginatedContactsResponse",
     "AdminCreate", "AdminLogin", "AdminResponse", "Token", "TokenData"
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, List, Literal
+
+# Upper bound on explicit id lists; larger selections should use a filter
+MAX_BULK_IDS = 5000
+
+
+class PostBulkFilter(BaseModel):
+    is_public: Optional[bool] = None
+    created_before: Optional[datetime] = None
+    created_after: Optional[datetime] = None
+
+
+class PostBulkRequest(BaseModel):
+    action: Literal["delete", "publish", "unpublish"]
+    ids: Optional[List[int]] = Field(default=None, max_length=MAX_BULK_IDS)
+    filter: Optional[PostBulkFilter] = None
+
+
+class ServiceBulkFilter(BaseModel):
+    is_published: Optional[bool] = None
+    is_featured: Optional[bool] = None
+
+
+class ServiceBulkRequest(BaseModel):
+    action: Literal["delete", "publish", "unpublish", "feature", "unfeature"]
+    ids: Optional[List[int]] = Field(default=None, max_length=MAX_BULK_IDS)
+    filter: Optional[ServiceBulkFilter] = None
+
+
+class ContactBulkFilter(BaseModel):
+    is_read: Optional[bool] = None
+    is_secret: Optional[bool] = None
+    has_reply: Optional[bool] = None
+    created_before: Optional[datetime] = None
+    created_after: Optional[datetime] = None
+
+
+class ContactBulkRequest(BaseModel):
+    action: Literal["delete", "mark_read", "mark_unread"]
+    ids: Optional[List[int]] = Field(default=None, max_length=MAX_BULK_IDS)
+    filter: Optional[ContactBulkFilter] = None
+
+
+class BulkResult(BaseModel):
+    action: str
+    affected: int
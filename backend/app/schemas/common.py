@@ -0,0 +1,4 @@
+from typing import Literal
+
+# Content languages stored per row as <field>_ko / <field>_en / <field>_zh
+Language = Literal["ko", "en", "zh"]
@@ -52,7 +52,9 @@ class ContactReply(BaseModel):
 
 class PaginatedContactsResponse(BaseModel):
     items: List[ContactResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # None when count=none
+    page: Optional[int] = None  # None in cursor mode
     limit: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
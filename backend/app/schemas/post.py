@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
+from app.schemas.common import Language
 
 
 class PostBase(BaseModel):
@@ -39,6 +40,19 @@ class PostResponse(PostBase):
         from_attributes = True
 
 
+class PostLocalizedResponse(BaseModel):
+    """Single-language post (GET /api/posts/{id}?lang=...)."""
+    id: int
+    lang: Language
+    title: str
+    content: str
+    thumbnail_url: Optional[str] = None
+    is_public: bool
+    view_count: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
 class PostListResponse(BaseModel):
     id: int
     title_ko: str
@@ -48,6 +62,9 @@ class PostListResponse(BaseModel):
     is_public: bool
     view_count: int
     created_at: datetime
+    # Resized thumbnail variants by MIME type, preferred first:
+    # {"image/avif": "/uploads/x-320w.avif 320w, ...", "image/webp": "..."}
+    thumbnail_srcset: Optional[Dict[str, str]] = None
 
     class Config:
         from_attributes = True
@@ -55,7 +72,9 @@ class PostListResponse(BaseModel):
 
 class PaginatedPostsResponse(BaseModel):
     items: List[PostListResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # None when count=none
+    page: Optional[int] = None  # None in cursor mode
     limit: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Optional, List, Literal
+
+
+class SearchResult(BaseModel):
+    kind: Literal["post", "service"]
+    id: int
+    title_ko: str
+    title_en: Optional[str] = None
+    title_zh: Optional[str] = None
+    snippet: str  # HTML-escaped text with matches wrapped in <mark>
+    score: float  # bm25 rank, lower is better
+
+
+class SearchResponse(BaseModel):
+    items: List[SearchResult]
+    limit: int
+    next_cursor: Optional[str] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional, List
+from app.schemas.common import Language
 
 
 class ServiceBase(BaseModel):
@@ -42,6 +43,20 @@ class ServiceResponse(ServiceBase):
         from_attributes = True
 
 
+class ServiceLocalizedResponse(BaseModel):
+    """Single-language service (GET /api/services/{id}?lang=...)."""
+    id: int
+    lang: Language
+    title: str
+    description: str
+    icon: Optional[str] = None
+    is_published: bool
+    is_featured: bool
+    order: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
 class ServiceListResponse(BaseModel):
     id: int
     title_ko: str
@@ -61,7 +76,9 @@ class ServiceListResponse(BaseModel):
 
 class PaginatedServicesResponse(BaseModel):
     items: List[ServiceListResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # None when count=none
+    page: Optional[int] = None  # None in cursor mode
     limit: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List, Literal
+from app.schemas.post import PostBase
+from app.schemas.service import ServiceBase
+from app.schemas.contact import ContactBase
+
+# Tables that can be exported and imported as NDJSON
+TransferResource = Literal["posts", "services", "contacts"]
+
+
+# One NDJSON line of an import, in the shape the export writes. `id` and
+# `created_at` are optional: without them the row gets new values.
+
+class PostImport(PostBase):
+    id: Optional[int] = None
+    view_count: int = 0
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ServiceImport(ServiceBase):
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ContactImport(ContactBase):
+    id: Optional[int] = None
+    secret_password: Optional[str] = None  # bcrypt hash, as exported
+    admin_reply: Optional[str] = None
+    reply_is_public: bool = True
+    replied_at: Optional[datetime] = None
+    is_read: bool = False
+    created_at: Optional[datetime] = None
+
+
+class ImportLineError(BaseModel):
+    line: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[ImportLineError]  # the first IMPORT_MAX_ERRORS failures
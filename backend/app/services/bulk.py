@@ -0,0 +1,128 @@
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.contact import Contact
+from app.models.post import Post
+from app.models.service import Service
+from app.schemas.bulk import ContactBulkRequest, PostBulkRequest, ServiceBulkRequest
+from app.services.search import reindex, remove_from_index
+from app.services.uploads import release_post_references
+from app.utils.invalidation import invalidate
+
+# Rows re-read per search index refresh (bounded by SQLite's bind parameter limit)
+REINDEX_BATCH_SIZE = 500
+
+POST_ACTIONS: Dict[str, Optional[Dict]] = {
+    "delete": None,
+    "publish": {"is_public": True},
+    "unpublish": {"is_public": False},
+}
+
+SERVICE_ACTIONS: Dict[str, Optional[Dict]] = {
+    "delete": None,
+    "publish": {"is_published": True},
+    "unpublish": {"is_published": False},
+    "feature": {"is_featured": True},
+    "unfeature": {"is_featured": False},
+}
+
+CONTACT_ACTIONS: Dict[str, Optional[Dict]] = {
+    "delete": None,
+    "mark_read": {"is_read": True},
+    "mark_unread": {"is_read": False},
+}
+
+
+def _flags(model, bulk_filter, *names: str) -> List:
+    return [getattr(model, name) == getattr(bulk_filter, name) for name in names if getattr(bulk_filter, name) is not None]
+
+
+def _created_range(model, bulk_filter) -> List:
+    conditions = []
+    if bulk_filter.created_before is not None:
+        conditions.append(model.created_at < bulk_filter.created_before)
+    if bulk_filter.created_after is not None:
+        conditions.append(model.created_at >= bulk_filter.created_after)
+    return conditions
+
+
+def _selection(model, ids: Optional[List[int]], conditions: List):
+    """WHERE clause for the selected rows; `ids` and filter conditions are combined with AND."""
+    if ids is not None:
+        conditions = [model.id.in_(ids), *conditions]
+    if not conditions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Select rows with `ids` or a non-empty `filter`"
+        )
+    return and_(*conditions)
+
+
+def _apply(session: Session, model, where, values: Optional[Dict], search_kind: Optional[str], refresh_search: bool) -> int:
+    """
+    Run one set-based UPDATE (or DELETE when `values` is None) and return the
+    number of rows it touched.
+
+    Core statements skip the ORM mapper events, so the search index and
+    upload reference counts those events maintain are updated here, in the
+    same transaction. The SQL triggers (dashboard counters, row versions)
+    still fire.
+    """
+    conn = session.connection()
+    table = model.__table__
+
+    if values is None:
+        if model is Post:
+            release_post_references(conn, where)
+        ids = list(conn.execute(delete(table).where(where).returning(table.c.id)).scalars())
+        if search_kind is not None:
+            remove_from_index(conn, search_kind, ids)
+        return len(ids)
+
+    ids = list(conn.execute(update(table).where(where).values(**values).returning(table.c.id)).scalars())
+    if search_kind is not None and refresh_search:
+        for start in range(0, len(ids), REINDEX_BATCH_SIZE):
+            reindex(conn, search_kind, ids[start:start + REINDEX_BATCH_SIZE])
+    return len(ids)
+
+
+async def _run(db: AsyncSession, model, where, values: Optional[Dict], search_kind: Optional[str] = None, refresh_search: bool = False) -> int:
+    affected = await db.run_sync(_apply, model, where, values, search_kind, refresh_search)
+    await db.commit()
+    if affected:
+        invalidate(model.__tablename__)
+    return affected
+
+
+async def bulk_posts(db: AsyncSession, request: PostBulkRequest) -> int:
+    conditions = []
+    if request.filter is not None:
+        conditions = _flags(Post, request.filter, "is_public") + _created_range(Post, request.filter)
+    values = POST_ACTIONS[request.action]
+    # Publishing changes search visibility; deletes are unindexed either way
+    return await _run(db, Post, _selection(Post, request.ids, conditions), values, "post", refresh_search=True)
+
+
+async def bulk_services(db: AsyncSession, request: ServiceBulkRequest) -> int:
+    conditions = []
+    if request.filter is not None:
+        conditions = _flags(Service, request.filter, "is_published", "is_featured")
+    values = SERVICE_ACTIONS[request.action]
+    return await _run(
+        db, Service, _selection(Service, request.ids, conditions), values, "service",
+        refresh_search=values is not None and "is_published" in values
+    )
+
+
+async def bulk_contacts(db: AsyncSession, request: ContactBulkRequest) -> int:
+    conditions = []
+    if request.filter is not None:
+        conditions = _flags(Contact, request.filter, "is_read", "is_secret") + _created_range(Contact, request.filter)
+        if request.filter.has_reply is not None:
+            has_reply = Contact.admin_reply.is_not(None)
+            conditions.append(has_reply if request.filter.has_reply else ~has_reply)
+    return await _run(db, Contact, _selection(Contact, request.ids, conditions), CONTACT_ACTIONS[request.action])
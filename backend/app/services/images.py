@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import os
+import posixpath
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.image_variant import ImageVariant
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_URL_PREFIX = "/uploads/"
+
+# Variant formats in order of preference, with the MIME type used as srcset key
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+
+def render_variants(source_path: str, widths: List[int], formats: List[str], quality: int) -> List[Dict]:
+    """
+    Write resized copies of an image next to it and describe them.
+
+    Runs in a worker process. Images are never upscaled: widths beyond the
+    original collapse into one variant at the original width. Animated
+    images are skipped. Formats the installed Pillow cannot encode (AVIF
+    before Pillow 11.2 without the pillow-avif-plugin) are skipped.
+    """
+    from PIL import Image, ImageOps
+    try:
+        import pillow_avif  # noqa: F401 - registers the AVIF codec on older Pillow
+    except ImportError:
+        pass
+    Image.init()
+
+    source = Path(source_path)
+    variants = []
+    with Image.open(source) as original:
+        if getattr(original, "is_animated", False):
+            return []
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or "A" in image.getbands() else "RGB")
+
+        targets = sorted({min(width, image.width) for width in widths})
+        resized = {
+            width: image if width == image.width else image.resize(
+                (width, max(1, round(image.height * width / image.width))),
+                Image.LANCZOS,
+                reducing_gap=3.0
+            )
+            for width in targets
+        }
+
+        for fmt in formats:
+            if fmt.upper() not in Image.SAVE:
+                continue
+            for width, variant in resized.items():
+                filename = f"{source.stem}-{width}w.{fmt}"
+                temp_path = source.with_name(f".{filename}.part")
+                variant.save(temp_path, format=fmt.upper(), quality=quality)
+                os.replace(temp_path, source.with_name(filename))
+                variants.append({
+                    "filename": filename,
+                    "format": fmt,
+                    "width": variant.width,
+                    "height": variant.height,
+                    "size": source.with_name(filename).stat().st_size,
+                })
+    return variants
+
+
+class ImageProcessor:
+    """
+    Generates responsive variants of uploaded images on a process pool.
+
+    Decoding and resizing a multi-megabyte image is CPU-bound and holds the
+    GIL, so it runs in separate processes. Pillow is optional: without it
+    (or on any decoding error) uploads simply get no variants.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.available = True  # False once Pillow turned out to be missing
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def render(self, filename: str) -> List[Dict]:
+        """Render variants of an upload; returns [] if they cannot be produced."""
+        if not self.available:
+            return []
+        source_path = str(Path(settings.UPLOAD_DIR) / filename)
+        try:
+            variants = await asyncio.get_running_loop().run_in_executor(
+                self._pool(),
+                render_variants,
+                source_path,
+                settings.IMAGE_VARIANT_WIDTHS,
+                [fmt for fmt in settings.IMAGE_VARIANT_FORMATS if fmt in MIME_TYPES],
+                settings.IMAGE_VARIANT_QUALITY
+            )
+        except ImportError:
+            self.available = False
+            logger.warning("Pillow is not installed; not generating image variants")
+        except Exception:
+            logger.exception("Failed to generate image variants for %s", filename)
+        else:
+            # Variants sit next to the source; record their paths relative to UPLOAD_DIR
+            directory = posixpath.dirname(filename)
+            return [{**variant, "filename": posixpath.join(directory, variant["filename"])} for variant in variants]
+        return []
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+image_processor = ImageProcessor(workers=settings.IMAGE_WORKERS)
+
+
+async def create_variants(db: AsyncSession, filename: str) -> List[ImageVariant]:
+    """Render and record the variants of a freshly uploaded image."""
+    variants = [
+        ImageVariant(source=filename, **variant)
+        for variant in await image_processor.render(filename)
+    ]
+    if variants:
+        db.add_all(variants)
+        await db.commit()
+    return variants
+
+
+async def get_variants(db: AsyncSession, filename: str) -> List[ImageVariant]:
+    """Recorded variants of an upload, in srcset order."""
+    return list((await db.scalars(select(ImageVariant).where(ImageVariant.source == filename).order_by(
+        ImageVariant.format,
+        ImageVariant.width
+    ))).all())
+
+
+def upload_filename(url: Optional[str]) -> Optional[str]:
+    """Filename of an upload from its (relative or absolute) URL, else None."""
+    if not url:
+        return None
+    path = urlsplit(url).path
+    if not path.startswith(UPLOAD_URL_PREFIX):
+        return None
+    return path[len(UPLOAD_URL_PREFIX):] or None
+
+
+def build_srcsets(variants: Iterable[ImageVariant]) -> Dict[str, str]:
+    """{"image/avif": "/uploads/x-320w.avif 320w, ...", "image/webp": ...}, preferred format first."""
+    candidates: Dict[str, List[str]] = {}
+    for variant in sorted(variants, key=lambda v: (list(MIME_TYPES).index(v.format), v.width)):
+        candidates.setdefault(MIME_TYPES[variant.format], []).append(
+            f"{UPLOAD_URL_PREFIX}{variant.filename} {variant.width}w"
+        )
+    return {mime: ", ".join(entries) for mime, entries in candidates.items()}
+
+
+async def attach_srcsets(db: AsyncSession, items: List[Dict]) -> List[Dict]:
+    """Fill `thumbnail_srcset` on post list items (dicts) from their thumbnails' variants (one query)."""
+    sources = {item["thumbnail_url"]: upload_filename(item["thumbnail_url"]) for item in items}
+    names = {name for name in sources.values() if name}
+    if not names:
+        return items
+
+    by_source: Dict[str, List[ImageVariant]] = {}
+    for variant in (await db.scalars(select(ImageVariant).where(ImageVariant.source.in_(names)))).all():
+        by_source.setdefault(variant.source, []).append(variant)
+
+    for item in items:
+        variants = by_source.get(sources[item["thumbnail_url"]])
+        if variants:
+            item["thumbnail_srcset"] = build_srcsets(variants)
+    return items
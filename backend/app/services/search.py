@@ -0,0 +1,215 @@
+import html
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Connection, event, select, text
+
+from app.models.post import Post
+from app.models.service import Service
+
+SEARCH_TABLE = "search_index"
+
+# rowid = id * 2 + kind code, so an indexed row is found by rowid (O(log n))
+KIND_CODES = {"post": 0, "service": 1}
+KINDS = {code: kind for kind, code in KIND_CODES.items()}
+
+# bm25 weights per FTS column (title, body)
+RANK_FUNCTION = "bm25(10.0, 1.0)"
+
+LANGUAGES = ("ko", "en", "zh")
+
+# Scripts written without spaces between words (Hangul, kana, CJK ideographs)
+_CJK = "\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7a3\uf900-\ufaff"
+_RUNS = re.compile(rf"([{_CJK}]+)|([^\W_{_CJK}]+)")
+
+
+def _runs(value: str) -> List[Tuple[str, bool]]:
+    """Split text into (run, is_cjk) pieces, dropping punctuation and spaces."""
+    return [
+        (cjk or word, bool(cjk))
+        for cjk, word in _RUNS.findall(value.lower())
+    ]
+
+
+def _bigrams(run: str) -> List[str]:
+    """Overlapping bigrams of a CJK run, plus its last character so single-character queries match."""
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)] + [run[-1]]
+
+
+def tokenize(value: Optional[str]) -> str:
+    """
+    Pre-tokenize text for the FTS index.
+
+    FTS5's unicode61 tokenizer treats a whole run of Hangul or Chinese
+    characters as a single token, so Korean and Chinese text is indexed as
+    space-separated overlapping bigrams instead; other words pass through.
+    """
+    if not value:
+        return ""
+    tokens: List[str] = []
+    for run, is_cjk in _runs(value):
+        tokens.extend(_bigrams(run) if is_cjk else [run])
+    return " ".join(tokens)
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    Translate user input into an FTS5 MATCH expression.
+
+    Each CJK run becomes a phrase of its bigrams (so they must be adjacent),
+    other words become prefix queries; all pieces must match.
+    """
+    parts = []
+    for run, is_cjk in _runs(query):
+        if is_cjk and len(run) > 1:
+            parts.append('"%s"' % " ".join(_bigrams(run)[:-1]))
+        else:
+            parts.append('"%s"*' % run)
+    return " ".join(parts) or None
+
+
+def search_terms(query: str) -> List[str]:
+    """Raw terms to highlight in snippets."""
+    return [run for run, _ in _runs(query)]
+
+
+def _document(kind: str, row) -> Tuple[str, str]:
+    field = "content" if kind == "post" else "description"
+    title = " ".join(tokenize(getattr(row, f"title_{lang}")) for lang in LANGUAGES)
+    body = " ".join(tokenize(getattr(row, f"{field}_{lang}")) for lang in LANGUAGES)
+    return title, body
+
+
+def _rowid(kind: str, ref_id: int) -> int:
+    return ref_id * 2 + KIND_CODES[kind]
+
+
+def split_rowid(rowid: int) -> Tuple[str, int]:
+    return KINDS[rowid % 2], rowid // 2
+
+
+# ============ Index maintenance ============
+
+def create_search_index(conn: Connection) -> None:
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+        f"USING fts5(title, body, tokenize = 'unicode61 remove_diacritics 2')"
+    ))
+    conn.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rank) VALUES ('rank', :rank)"),
+                 {"rank": RANK_FUNCTION})
+
+
+def _index_row(conn: Connection, kind: str, row, visible: bool) -> None:
+    rowid = _rowid(kind, row.id)
+    conn.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid"), {"rowid": rowid})
+    if visible:
+        title, body = _document(kind, row)
+        conn.execute(
+            text(f"INSERT INTO {SEARCH_TABLE}(rowid, title, body) VALUES (:rowid, :title, :body)"),
+            {"rowid": rowid, "title": title, "body": body}
+        )
+
+
+def remove_from_index(conn: Connection, kind: str, ids: Iterable[int]) -> None:
+    params = [{"rowid": _rowid(kind, ref_id)} for ref_id in ids]
+    if params:
+        conn.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid"), params)
+
+
+def reindex(conn: Connection, kind: str, ids: Iterable[int]) -> None:
+    """Re-read the given rows and refresh their index entries."""
+    model, visible = (Post, Post.is_public) if kind == "post" else (Service, Service.is_published)
+    ids = list(ids)
+    if not ids:
+        return
+    remove_from_index(conn, kind, ids)
+    params = []
+    for row in conn.execute(select(model.__table__).where(model.id.in_(ids), visible == True)):
+        title, body = _document(kind, row)
+        params.append({"rowid": _rowid(kind, row.id), "title": title, "body": body})
+    if params:
+        conn.execute(text(f"INSERT INTO {SEARCH_TABLE}(rowid, title, body) VALUES (:rowid, :title, :body)"), params)
+
+
+def rebuild_search_index(conn: Connection, batch_size: int = 1000) -> None:
+    """Rebuild the whole index from posts and services."""
+    conn.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    insert = text(f"INSERT INTO {SEARCH_TABLE}(rowid, title, body) VALUES (:rowid, :title, :body)")
+    for kind, model, visible in (("post", Post, Post.is_public), ("service", Service, Service.is_published)):
+        result = conn.execution_options(yield_per=batch_size).execute(
+            select(model.__table__).where(visible == True)
+        )
+        for rows in result.partitions():
+            params = []
+            for row in rows:
+                title, body = _document(kind, row)
+                params.append({"rowid": _rowid(kind, row.id), "title": title, "body": body})
+            conn.execute(insert, params)
+
+
+# Keep the index in step with ORM writes, in the same transaction
+@event.listens_for(Post, "after_insert")
+@event.listens_for(Post, "after_update")
+def _sync_post(mapper, connection, target: Post):
+    _index_row(connection, "post", target, bool(target.is_public))
+
+
+@event.listens_for(Service, "after_insert")
+@event.listens_for(Service, "after_update")
+def _sync_service(mapper, connection, target: Service):
+    _index_row(connection, "service", target, bool(target.is_published))
+
+
+@event.listens_for(Post, "after_delete")
+def _unindex_post(mapper, connection, target: Post):
+    remove_from_index(connection, "post", [target.id])
+
+
+@event.listens_for(Service, "after_delete")
+def _unindex_service(mapper, connection, target: Service):
+    remove_from_index(connection, "service", [target.id])
+
+
+# ============ Snippets ============
+
+def highlight(value: Optional[str], terms: List[str], width: int = 80) -> Optional[str]:
+    """
+    HTML snippet of `value` around the first matching term, with matches in <mark>.
+
+    Returns None if no term occurs in the text.
+    """
+    if not value or not terms:
+        return None
+
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    match = pattern.search(value)
+    if match is None:
+        return None
+
+    start = max(0, match.start() - width // 2)
+    end = min(len(value), start + width)
+    window = value[start:end]
+
+    parts, last = [], 0
+    for m in pattern.finditer(window):
+        parts.append(html.escape(window[last:m.start()]))
+        parts.append(f"<mark>{html.escape(m.group())}</mark>")
+        last = m.end()
+    parts.append(html.escape(window[last:]))
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(value) else ""
+    return prefix + "".join(parts).replace("\n", " ") + suffix
+
+
+def best_snippet(texts: Dict[str, Optional[str]], terms: List[str], lang: Optional[str]) -> str:
+    """Snippet from the preferred language first, then the others, else the text's start."""
+    order = ([lang] if lang else []) + [code for code in LANGUAGES if code != lang]
+    for code in order:
+        snippet = highlight(texts.get(code), terms)
+        if snippet:
+            return snippet
+    fallback = next((texts[code] for code in order if texts.get(code)), "")
+    return html.escape(fallback[:80]).replace("\n", " ") + ("…" if len(fallback) > 80 else "")
@@ -0,0 +1,104 @@
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Connection, case, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.contact import Contact
+from app.models.counter import Counter
+from app.models.post import Post
+from app.models.service import Service
+
+# Dashboard counters per table: (counter name, SQL predicate over a row).
+# "{row}" is replaced by NEW/OLD inside triggers and by the table name in
+# the aggregate query, so both are derived from the same definition.
+COUNTERS: Dict[str, List[Tuple[str, str]]] = {
+    Post.__tablename__: [
+        ("total_posts", "1"),
+        ("public_posts", "{row}.is_public = 1"),
+    ],
+    Contact.__tablename__: [
+        ("total_contacts", "1"),
+        ("unread_contacts", "{row}.is_read = 0"),
+        ("unreplied_contacts", "{row}.admin_reply IS NULL"),
+    ],
+    Service.__tablename__: [
+        ("total_services", "1"),
+        ("published_services", "{row}.is_published = 1"),
+        ("featured_services", "{row}.is_featured = 1"),
+    ],
+}
+
+# Columns whose updates can move a counter; other updates skip the trigger
+COUNTED_COLUMNS: Dict[str, List[str]] = {
+    Post.__tablename__: ["is_public"],
+    Contact.__tablename__: ["is_read", "admin_reply"],
+    Service.__tablename__: ["is_published", "is_featured"],
+}
+
+
+def _flag(predicate: str, row: str) -> str:
+    return f"IFNULL(({predicate.format(row=row)}), 0)"
+
+
+def _trigger_sql(table: str, event: str) -> str:
+    counters = COUNTERS[table]
+    if event == "INSERT":
+        delta = {name: _flag(predicate, "NEW") for name, predicate in counters}
+        timing = f"AFTER INSERT ON {table}"
+    elif event == "DELETE":
+        delta = {name: f"-{_flag(predicate, 'OLD')}" for name, predicate in counters}
+        timing = f"AFTER DELETE ON {table}"
+    else:
+        counters = [(name, predicate) for name, predicate in counters if predicate != "1"]
+        delta = {
+            name: f"{_flag(predicate, 'NEW')} - {_flag(predicate, 'OLD')}"
+            for name, predicate in counters
+        }
+        timing = f"AFTER UPDATE OF {', '.join(COUNTED_COLUMNS[table])} ON {table}"
+
+    whens = " ".join(f"WHEN '{name}' THEN {expr}" for name, expr in delta.items())
+    names = ", ".join(f"'{name}'" for name in delta)
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_counters_{event.lower()} {timing} "
+        f"BEGIN UPDATE {Counter.__tablename__} SET value = value + CASE name {whens} ELSE 0 END "
+        f"WHERE name IN ({names}); END"
+    )
+
+
+def install_counter_triggers(conn: Connection) -> None:
+    """Create the triggers that keep `counters` in step with every write."""
+    for table in COUNTERS:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(text(_trigger_sql(table, event)))
+
+
+def _aggregate_query(table: str):
+    """One conditional aggregate (SUM(CASE ...)) computing all counters of a table."""
+    return select(*[
+        func.coalesce(func.sum(case((text(predicate.format(row=table)), 1), else_=0)), 0).label(name)
+        for name, predicate in COUNTERS[table]
+    ]).select_from(text(table))
+
+
+def recompute_counters(conn: Connection) -> None:
+    """Rebuild every counter from a single pass over each table."""
+    for table in COUNTERS:
+        row = conn.execute(_aggregate_query(table)).mappings().one()
+        for name, value in row.items():
+            conn.execute(
+                text(f"INSERT OR REPLACE INTO {Counter.__tablename__} (name, value) VALUES (:name, :value)"),
+                {"name": name, "value": value}
+            )
+
+
+async def get_dashboard_counters(db: AsyncSession) -> Dict[str, int]:
+    """Read all dashboard counters (one row per counter, independent of table size)."""
+    rows = (await db.execute(select(Counter.name, Counter.value))).all()
+    stats = {name: value for name, value in rows}
+
+    # Counters are seeded at startup; fall back to the aggregates if one is missing
+    for table, counters in COUNTERS.items():
+        if any(name not in stats for name, _ in counters):
+            stats.update((await db.execute(_aggregate_query(table))).mappings().one())
+
+    return {name: stats[name] for counters in COUNTERS.values() for name, _ in counters}
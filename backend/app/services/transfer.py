@@ -0,0 +1,172 @@
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
+from sqlalchemy import insert, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import AsyncReadSessionLocal
+from app.models.contact import Contact
+from app.models.post import Post
+from app.models.service import Service
+from app.schemas.transfer import ContactImport, ImportLineError, ImportResult, PostImport, ServiceImport
+from app.services.search import reindex
+from app.services.uploads import retain_post_references
+from app.utils.invalidation import invalidate
+
+# resource -> (model, import row schema, search index kind)
+RESOURCES: Dict[str, Tuple[type, Type[BaseModel], Optional[str]]] = {
+    "posts": (Post, PostImport, "post"),
+    "services": (Service, ServiceImport, "service"),
+    "contacts": (Contact, ContactImport, None),
+}
+
+# Maintained by triggers; a fresh copy starts over
+EXPORT_EXCLUDED_COLUMNS = {"version"}
+
+
+def export_columns(model) -> List:
+    return [column for column in model.__table__.columns if column.name not in EXPORT_EXCLUDED_COLUMNS]
+
+
+async def export_ndjson(resource: str) -> AsyncIterator[bytes]:
+    """
+    Every row of a table as NDJSON, in id order.
+
+    Rows come from a server-side cursor `EXPORT_BATCH_SIZE` at a time and
+    each batch is encoded and sent before the next is fetched, so memory
+    stays flat however large the table is. Uses its own read-only session:
+    the body is streamed after the request's dependencies have closed.
+    """
+    model = RESOURCES[resource][0]
+    columns = export_columns(model)
+    names = [column.name for column in columns]
+    async with AsyncReadSessionLocal() as db:
+        result = await db.stream(
+            select(*columns).order_by(model.__table__.c.id).execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield b"".join([to_json(dict(zip(names, row))) + b"\n" for row in rows])
+
+
+async def ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    (line number, line) for each non-blank line of a streamed NDJSON body.
+
+    A line longer than IMPORT_MAX_LINE_SIZE is skipped and reported as None.
+    """
+    buffer = b""
+    number = 0
+    oversized = False
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            if oversized:
+                oversized = False
+                yield number, None
+            elif line.strip():
+                yield number, line
+        if len(buffer) > settings.IMPORT_MAX_LINE_SIZE:
+            oversized, buffer = True, b""
+    if oversized or buffer.strip():
+        yield number + 1, None if oversized else buffer
+
+
+def _insert(session: Session, model, search_kind: Optional[str], rows: List[Dict]) -> int:
+    """
+    Insert rows with one executemany INSERT, then index them and count their
+    upload references (Core inserts skip the ORM mapper events for that).
+    """
+    conn = session.connection()
+    table = model.__table__
+    if search_kind is None and model is not Post:
+        return conn.execute(insert(table), rows).rowcount
+    ids = list(conn.execute(insert(table).returning(table.c.id), rows).scalars())
+    if search_kind is not None:
+        reindex(conn, search_kind, ids)
+    if model is Post:
+        retain_post_references(conn, Post.id.in_(ids))
+    return len(ids)
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, error['loc']))}: {error['msg']}" if error["loc"] else error["msg"]
+        for error in exc.errors()
+    )
+
+
+class NDJSONImporter:
+    """
+    Inserts a stream of NDJSON rows in batches of IMPORT_BATCH_SIZE.
+
+    Each batch is one executemany INSERT and one commit. If a batch fails
+    (e.g. a duplicate id), it is rolled back and retried row by row so the
+    valid rows still go in and each bad one is reported with its line.
+    """
+
+    def __init__(self, db: AsyncSession, resource: str):
+        self.db = db
+        self.model, self.schema, self.search_kind = RESOURCES[resource]
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[ImportLineError] = []
+        self._batch: List[Tuple[int, Dict]] = []
+
+    def _error(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append(ImportLineError(line=line, error=error))
+
+    async def add(self, line: int, data: Optional[bytes]) -> None:
+        if data is None:
+            self._error(line, f"Line longer than {settings.IMPORT_MAX_LINE_SIZE} bytes")
+            return
+        try:
+            row = self.schema.model_validate_json(data).model_dump()
+        except ValidationError as exc:
+            self._error(line, _describe(exc))
+            return
+        if row["created_at"] is None:
+            row["created_at"] = datetime.utcnow()
+        self._batch.append((line, row))
+        if len(self._batch) >= settings.IMPORT_BATCH_SIZE:
+            await self.flush()
+
+    async def _write(self, rows: List[Dict]) -> int:
+        inserted = await self.db.run_sync(_insert, self.model, self.search_kind, rows)
+        await self.db.commit()
+        return inserted
+
+    async def flush(self) -> None:
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        try:
+            self.inserted += await self._write([row for _, row in batch])
+            return
+        except DBAPIError:
+            await self.db.rollback()
+
+        for line, row in batch:
+            try:
+                self.inserted += await self._write([row])
+            except DBAPIError as exc:
+                await self.db.rollback()
+                self._error(line, str(exc.orig))
+
+    async def run(self, chunks: AsyncIterator[bytes]) -> ImportResult:
+        try:
+            async for line, data in ndjson_lines(chunks):
+                await self.add(line, data)
+            await self.flush()
+        finally:
+            if self.inserted:
+                invalidate(self.model.__tablename__)
+        return ImportResult(inserted=self.inserted, failed=self.failed, errors=self.errors)
@@ -0,0 +1,342 @@
+import hashlib
+import re
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, Request, status
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+from sqlalchemy import Connection, event, inspect, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.post import Post
+from app.models.upload import Upload
+
+# Accepted image formats: (MIME type, stored extension, accepted extensions, signature check)
+IMAGE_FORMATS: List[Tuple[str, str, Tuple[str, ...], Callable[[bytes], bool]]] = [
+    ("image/jpeg", ".jpg", (".jpg", ".jpeg"), lambda head: head.startswith(b"\xff\xd8\xff")),
+    ("image/png", ".png", (".png",), lambda head: head.startswith(b"\x89PNG\r\n\x1a\n")),
+    ("image/gif", ".gif", (".gif",), lambda head: head[:6] in (b"GIF87a", b"GIF89a")),
+    ("image/webp", ".webp", (".webp",), lambda head: head[:4] == b"RIFF" and head[8:12] == b"WEBP"),
+]
+
+# Bytes needed to recognise every format above
+SNIFF_SIZE = 12
+
+# Headers, boundaries and small form fields that may surround the file part
+MULTIPART_OVERHEAD = 16 * 1024
+
+# Content-addressed upload paths as they appear in URLs and post content
+UPLOAD_PATH = re.compile(r"/uploads/([0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}\.[a-z]+)")
+
+
+def detect_format(extension: str, head: bytes) -> Optional[Tuple[str, str]]:
+    """(MIME type, stored extension) if the first bytes match the format the extension claims."""
+    for mime, stored_extension, extensions, check in IMAGE_FORMATS:
+        if extension in extensions and check(head):
+            return mime, stored_extension
+    return None
+
+
+def content_path(sha256: str, extension: str) -> str:
+    """Sharded path of a file under UPLOAD_DIR, e.g. "ab/cd/abcd...ef.png"."""
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}{extension}"
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File size exceeds maximum allowed size ({settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB)"
+    )
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class StreamingUpload:
+    """
+    Receive one file field of a multipart request straight to disk.
+
+    The request body is fed to python-multipart chunk by chunk as it
+    arrives; file bytes are hashed and go to a temporary file in UPLOAD_DIR
+    through aiofiles, and the rest of the body is discarded, so memory use
+    is bounded by the transport's chunk size. The upload is rejected as
+    soon as it exceeds MAX_UPLOAD_SIZE or its first bytes do not match its
+    extension, and only a complete, valid file is renamed into place.
+    """
+
+    def __init__(self, request: Request, field: str, allowed_extensions: Iterable[str]):
+        self.request = request
+        self.field = field
+        self.allowed_extensions = set(allowed_extensions)
+        self.max_size = settings.MAX_UPLOAD_SIZE
+
+        self.filename: Optional[str] = None
+        self.extension = ""
+        self.mime = ""
+        self.size = 0
+        self.sha256 = ""
+        self._hash = hashlib.sha256()
+        self.temp_path: Optional[Path] = None
+        self._file = None
+        self._head = b""
+        self._finished = False
+
+        # Parser callbacks are synchronous; they queue work for the async loop
+        self._events: List[Tuple[str, bytes]] = []
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._in_file = False
+        self._seen_file = False
+
+    # ---- python-multipart callbacks ----
+
+    def _on_part_begin(self) -> None:
+        self._disposition = b""
+        self._in_file = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        if options.get(b"name", b"").decode("latin-1") == self.field and b"filename" in options:
+            if self._seen_file:
+                raise _bad_request("Only one file may be uploaded at a time")
+            self._seen_file = True
+            self._in_file = True
+            self._events.append(("begin", options[b"filename"]))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._events.append(("data", data[start:end]))
+
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._events.append(("end", b""))
+
+    # ---- async side ----
+
+    async def _begin(self, raw_filename: bytes) -> None:
+        self.filename = raw_filename.decode("utf-8", errors="replace")
+        self.extension = Path(self.filename).suffix.lower()
+        if self.extension not in self.allowed_extensions:
+            raise _bad_request(f"File type not allowed. Allowed types: {', '.join(sorted(self.allowed_extensions))}")
+
+        upload_dir = Path(settings.UPLOAD_DIR)
+        await aiofiles.os.makedirs(upload_dir, exist_ok=True)
+        self.temp_path = upload_dir / f".upload-{uuid.uuid4().hex}.part"
+        self._file = await aiofiles.open(self.temp_path, "wb")
+
+    async def _write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise _too_large()
+
+        if len(self._head) < SNIFF_SIZE:
+            self._head += data[:SNIFF_SIZE - len(self._head)]
+            if len(self._head) >= SNIFF_SIZE:
+                self._check_signature()
+        self._hash.update(data)
+        await self._file.write(data)
+
+    async def _end(self) -> None:
+        if len(self._head) < SNIFF_SIZE:
+            self._check_signature()
+        await self._file.close()
+        self._file = None
+        self.sha256 = self._hash.hexdigest()
+        self._finished = True
+
+    def _check_signature(self) -> None:
+        detected = detect_format(self.extension, self._head)
+        if detected is None:
+            raise _bad_request("File content does not match its extension")
+        self.mime, self.extension = detected
+
+    async def receive(self) -> "StreamingUpload":
+        """Consume the request body; raises HTTPException on any rejection."""
+        content_type, params = parse_options_header(self.request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise _bad_request("Expected a multipart/form-data request")
+
+        content_length = self.request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_size + MULTIPART_OVERHEAD:
+            raise _too_large()
+
+        parser = MultipartParser(params[b"boundary"], {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+
+        try:
+            async for chunk in self.request.stream():
+                try:
+                    parser.write(chunk)
+                except MultipartParseError:
+                    raise _bad_request("Malformed multipart body")
+                events, self._events = self._events, []
+                for kind, data in events:
+                    if kind == "begin":
+                        await self._begin(data)
+                    elif kind == "data":
+                        await self._write(data)
+                    else:
+                        await self._end()
+        except BaseException:
+            await self.discard()
+            raise
+
+        if not self._finished:
+            await self.discard()
+            raise _bad_request(f"Missing file field '{self.field}'")
+        return self
+
+    async def save_as(self, filename: str) -> Path:
+        """Atomically move the received file into UPLOAD_DIR under `filename`."""
+        destination = Path(settings.UPLOAD_DIR) / filename
+        await aiofiles.os.makedirs(destination.parent, exist_ok=True)
+        await aiofiles.os.replace(self.temp_path, destination)
+        self.temp_path = None
+        return destination
+
+    async def discard(self) -> None:
+        """Remove the temporary file, if any."""
+        if self._file is not None:
+            await self._file.close()
+            self._file = None
+        if self.temp_path is not None:
+            try:
+                await aiofiles.os.remove(self.temp_path)
+            except FileNotFoundError:
+                pass
+            self.temp_path = None
+
+
+# ============ Content-addressed storage ============
+
+async def store_upload(db: AsyncSession, upload: StreamingUpload) -> Tuple[Upload, bool]:
+    """
+    Store a received upload under its content hash.
+
+    Returns the upload record and whether it is new. A duplicate keeps the
+    existing file (its temporary copy is discarded) and gets the existing
+    record, so identical content always maps to the same immutable URL.
+    """
+    record = await db.scalar(select(Upload).where(Upload.sha256 == upload.sha256))
+    path = record.path if record is not None else content_path(upload.sha256, upload.extension)
+
+    if record is not None and await aiofiles.os.path.exists(Path(settings.UPLOAD_DIR) / path):
+        await upload.discard()
+        return record, False
+
+    # Same content renames onto the same bytes, so a concurrent duplicate is harmless
+    await upload.save_as(path)
+    if record is not None:
+        return record, False
+
+    record = Upload(sha256=upload.sha256, path=path, mime=upload.mime, size=upload.size, refcount=0)
+    db.add(record)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Lost a race with an identical upload; use its record
+        await db.rollback()
+        return await db.scalar(select(Upload).where(Upload.sha256 == upload.sha256)), False
+    return record, True
+
+
+# ============ Reference counting ============
+
+def referenced_paths(*values: Optional[str]) -> Set[str]:
+    """Content-addressed upload paths mentioned in the given URLs / texts."""
+    return {path for value in values if value for path in UPLOAD_PATH.findall(value)}
+
+
+_REFERENCING_FIELDS = ("thumbnail_url", "content_ko", "content_en", "content_zh")
+
+
+def _post_references(target: Post, previous: bool = False) -> Set[str]:
+    values = []
+    for field in _REFERENCING_FIELDS:
+        history = inspect(target).attrs[field].history
+        if previous and history.deleted:
+            values.extend(history.deleted)
+        elif previous and history.added:
+            continue
+        else:
+            values.append(getattr(target, field))
+    return referenced_paths(*values)
+
+
+_ADJUST_REFCOUNT = text(f"UPDATE {Upload.__tablename__} SET refcount = MAX(0, refcount + :delta) WHERE path = :path")
+
+
+def _adjust_refcounts(conn: Connection, paths: Iterable[str], delta: int) -> None:
+    params = [{"path": path, "delta": delta} for path in paths]
+    if params:
+        conn.execute(_ADJUST_REFCOUNT, params)
+
+
+def _count_references_of(conn: Connection, where, sign: int) -> None:
+    counts: Counter = Counter()
+    columns = [Post.__table__.c[field] for field in _REFERENCING_FIELDS]
+    for row in conn.execute(select(*columns).where(where)):
+        counts.update(referenced_paths(*row))
+    params = [{"path": path, "delta": sign * count} for path, count in counts.items()]
+    if params:
+        conn.execute(_ADJUST_REFCOUNT, params)
+
+
+# Core INSERT/DELETE statements bypass the mapper events below; bulk
+# writers call these in the same transaction instead.
+
+def retain_post_references(conn: Connection, where) -> None:
+    """Count the references held by the posts matching `where` (after a bulk INSERT)."""
+    _count_references_of(conn, where, 1)
+
+
+def release_post_references(conn: Connection, where) -> None:
+    """Drop the references held by the posts matching `where` (before a bulk DELETE)."""
+    _count_references_of(conn, where, -1)
+
+
+# Count references from post thumbnails and bodies, in the writing transaction
+@event.listens_for(Post, "after_insert")
+def _count_post_references(mapper, connection, target: Post):
+    _adjust_refcounts(connection, _post_references(target), 1)
+
+
+@event.listens_for(Post, "after_update")
+def _recount_post_references(mapper, connection, target: Post):
+    before, after = _post_references(target, previous=True), _post_references(target)
+    _adjust_refcounts(connection, after - before, 1)
+    _adjust_refcounts(connection, before - after, -1)
+
+
+@event.listens_for(Post, "after_delete")
+def _release_post_references(mapper, connection, target: Post):
+    _adjust_refcounts(connection, _post_references(target), -1)
@@ -0,0 +1,81 @@
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Connection, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.counter import Counter
+from app.models.post import Post
+from app.models.service import Service
+
+# Columns that make up a row's public representation. Updating any of them
+# bumps the row's `version` and the table version; view count flushes and
+# timestamp-only updates do not.
+VERSIONED_COLUMNS: Dict[str, List[str]] = {
+    Post.__tablename__: [
+        "title_ko", "title_en", "title_zh",
+        "content_ko", "content_en", "content_zh",
+        "thumbnail_url", "is_public",
+    ],
+    Service.__tablename__: [
+        "title_ko", "title_en", "title_zh",
+        "description_ko", "description_en", "description_zh",
+        "icon", "is_published", "is_featured", '"order"',
+    ],
+}
+
+
+def version_counter(table: str) -> str:
+    """Counter bumped on every insert, delete and content update of `table`."""
+    return f"{table}_version"
+
+
+def modified_counter(table: str) -> str:
+    """Counter holding the unix time of the last change to `table`."""
+    return f"{table}_modified"
+
+
+def _bump_table_sql(table: str) -> str:
+    return (
+        f"UPDATE {Counter.__tablename__} SET value = CASE name "
+        f"WHEN '{version_counter(table)}' THEN value + 1 "
+        f"ELSE CAST(strftime('%s', 'now') AS INTEGER) END "
+        f"WHERE name IN ('{version_counter(table)}', '{modified_counter(table)}');"
+    )
+
+
+def _trigger_sql(table: str, event: str) -> str:
+    body = _bump_table_sql(table)
+    if event == "UPDATE":
+        timing = f"AFTER UPDATE OF {', '.join(VERSIONED_COLUMNS[table])} ON {table}"
+        body = f"UPDATE {table} SET version = version + 1 WHERE id = NEW.id; " + body
+    else:
+        timing = f"AFTER {event} ON {table}"
+    return f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()} {timing} BEGIN {body} END"
+
+
+def install_version_triggers(conn: Connection) -> None:
+    """Create the triggers that version rows and tables on every write, and seed the table counters."""
+    for table in VERSIONED_COLUMNS:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(text(_trigger_sql(table, event)))
+        conn.execute(
+            text(f"INSERT OR IGNORE INTO {Counter.__tablename__} (name, value) VALUES "
+                 f"(:version, 1), (:modified, CAST(strftime('%s', 'now') AS INTEGER))"),
+            {"version": version_counter(table), "modified": modified_counter(table)}
+        )
+
+
+def bump_table_versions(conn: Connection, *tables: str) -> None:
+    """Bump table versions by hand, for bulk loads that run with the triggers dropped."""
+    for table in tables:
+        conn.execute(text(_bump_table_sql(table)))
+
+
+async def get_table_versions(db: AsyncSession, *tables: str) -> Dict[str, Tuple[int, int]]:
+    """(version, last modified unix time) per table, read from the counters table."""
+    names = [name for table in tables for name in (version_counter(table), modified_counter(table))]
+    values = dict((await db.execute(select(Counter.name, Counter.value).where(Counter.name.in_(names)))).all())
+    return {
+        table: (values.get(version_counter(table), 0), values.get(modified_counter(table), 0))
+        for table in tables
+    }
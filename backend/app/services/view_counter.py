@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import threading
+from typing import Dict
+
+from sqlalchemy import case, func, update
+
+from app.database import AsyncSessionLocal
+from app.models.post import Post
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounterBuffer:
+    """
+    In-memory write-behind buffer for post view counts.
+
+    Increments are spread over a fixed number of shards (by post id), each
+    guarded by its own lock, and written back in a single batched
+    ``UPDATE ... CASE`` by ``flush()``. Readers add ``pending(post_id)`` to
+    the persisted value so the GET path never has to write.
+    """
+
+    def __init__(self, shards: int = 16):
+        self._shards: list[Dict[int, int]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._flush_lock = asyncio.Lock()
+
+    def _shard(self, post_id: int) -> int:
+        return post_id % len(self._shards)
+
+    def increment(self, post_id: int, amount: int = 1) -> None:
+        """Record `amount` views for a post."""
+        index = self._shard(post_id)
+        with self._locks[index]:
+            shard = self._shards[index]
+            shard[post_id] = shard.get(post_id, 0) + amount
+
+    def pending(self, post_id: int) -> int:
+        """Views recorded for a post but not yet flushed."""
+        index = self._shard(post_id)
+        with self._locks[index]:
+            return self._shards[index].get(post_id, 0)
+
+    def _drain(self) -> Dict[int, int]:
+        deltas: Dict[int, int] = {}
+        for index, lock in enumerate(self._locks):
+            with lock:
+                deltas.update(self._shards[index])
+                self._shards[index] = {}
+        return deltas
+
+    def _restore(self, deltas: Dict[int, int]) -> None:
+        for post_id, amount in deltas.items():
+            self.increment(post_id, amount)
+
+    async def flush(self) -> int:
+        """
+        Write all pending increments in one UPDATE.
+
+        Returns the number of posts updated. On failure the increments are put
+        back into the buffer so they are retried on the next flush.
+        """
+        async with self._flush_lock:
+            deltas = self._drain()
+            if not deltas:
+                return 0
+
+            stmt = (
+                update(Post)
+                .where(Post.id.in_(deltas.keys()))
+                .values(
+                    view_count=func.coalesce(Post.view_count, 0) + case(deltas, value=Post.id, else_=0),
+                    # Keep the onupdate hook from touching updated_at: views are not edits
+                    updated_at=Post.updated_at
+                )
+                .execution_options(synchronize_session=False)
+            )
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(stmt)
+                    await db.commit()
+            except Exception:
+                logger.exception("Failed to flush %d view counts; will retry", len(deltas))
+                self._restore(deltas)
+                return 0
+
+            return len(deltas)
+
+    async def run_periodic_flush(self, interval: float) -> None:
+        """Flush every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+
+view_counter = ViewCounterBuffer()
@@ -0,0 +1,80 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Union
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# Clients and proxies may store responses but must revalidate them first
+CACHE_CONTROL = "no-cache"
+
+
+def validators(*etag_parts, last_modified: Union[datetime, int, None] = None) -> Dict[str, str]:
+    """
+    ETag / Last-Modified / Cache-Control headers for a representation.
+
+    `etag_parts` must identify the exact response body, e.g. a row's id and
+    stored version plus any query parameters that change the payload.
+    `last_modified` is a datetime (naive values are taken as UTC, which is
+    what SQLite stores) or a unix timestamp.
+    """
+    digest = hashlib.blake2b(repr(etag_parts).encode(), digest_size=12).hexdigest()
+    headers = {"ETag": f'"{digest}"', "Cache-Control": CACHE_CONTROL}
+
+    if isinstance(last_modified, int):
+        last_modified = datetime.fromtimestamp(last_modified, tz=timezone.utc)
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    name = name.lower()
+    return next((value for key, value in headers.items() if key.lower() == name), None)
+
+
+def _etag_matches(if_none_match: str, etag: Optional[str]) -> bool:
+    if if_none_match.strip() == "*":
+        return etag is not None
+    # If-None-Match uses the weak comparison (RFC 9110 13.1.2)
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag is not None and etag.removeprefix("W/") in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: Optional[str]) -> bool:
+    if last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified(request: Request, headers: Mapping[str, str]) -> Optional[Response]:
+    """
+    A 304 response if the request's validators match `headers`, else None.
+
+    `headers` is what the full response would carry (see ``validators()``);
+    If-None-Match takes precedence over If-Modified-Since.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        matched = _etag_matches(if_none_match, _header(headers, "etag"))
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        matched = if_modified_since is not None and _not_modified_since(
+            if_modified_since, _header(headers, "last-modified")
+        )
+
+    if not matched:
+        return None
+    kept = {name: _header(headers, name) for name in ("ETag", "Last-Modified", "Cache-Control")}
+    return Response(status_code=304, headers={name: value for name, value in kept.items() if value is not None})
+
+
+def is_conditional(request: Request) -> bool:
+    """Whether the request carries validators worth a version lookup."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
@@ -0,0 +1,64 @@
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Select
+
+from app.config import settings
+
+
+class CountCache:
+    """
+    Cache of `SELECT COUNT(*)` results keyed by the filtered query.
+
+    Each table carries a generation number that write handlers bump through
+    ``invalidate()``. An exact lookup only hits if no table in the query has
+    been written since the count was stored; an estimate lookup accepts an
+    outdated count as long as it is younger than the TTL. The TTL also bounds
+    staleness from writes this process never sees (other workers, scripts).
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._generations: Dict[str, int] = {}
+        self._entries: Dict[Tuple, Tuple[int, Tuple[Tuple[str, int], ...], float]] = {}
+
+    @staticmethod
+    def key(query: Select) -> Tuple:
+        """Filter signature of a select: its SQL text plus bound parameter values."""
+        compiled = query.order_by(None).compile()
+        params = tuple(sorted((name, repr(value)) for name, value in compiled.params.items()))
+        return (str(compiled), params)
+
+    def _snapshot(self, query: Select) -> Tuple[Tuple[str, int], ...]:
+        tables = sorted({table.name for table in query.get_final_froms() if hasattr(table, "name")})
+        return tuple((name, self._generations.get(name, 0)) for name in tables)
+
+    def get(self, query: Select, allow_stale: bool = False) -> Optional[int]:
+        """Return the cached count, or None on a miss."""
+        entry = self._entries.get(self.key(query))
+        if entry is None:
+            return None
+
+        total, snapshot, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            return None
+        if not allow_stale and snapshot != self._snapshot(query):
+            return None
+        return total
+
+    def set(self, query: Select, total: int) -> None:
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[self.key(query)] = (total, self._snapshot(query), time.monotonic())
+
+    def invalidate(self, *tables: str) -> None:
+        """Mark cached counts over these tables as outdated."""
+        for name in tables:
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache(ttl=settings.COUNT_CACHE_TTL)
@@ -0,0 +1,87 @@
+import time
+from typing import Dict, List, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import Pool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolStats:
+    """
+    Checkout counters for one connection pool.
+
+    `wait` is the time a caller spent getting a connection from the pool
+    (including opening a new one); `hold` is how long it was kept before
+    being returned.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets: List[int] = [0] * (len(WAIT_BUCKETS) + 1)
+        self.hold_sum = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_sum += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        for index, bound in enumerate(WAIT_BUCKETS):
+            if seconds <= bound:
+                self.wait_buckets[index] += 1
+                break
+        else:
+            self.wait_buckets[-1] += 1
+
+    def stats(self, pool: Pool) -> Dict:
+        """Counters plus the pool's current occupancy."""
+        occupancy = {}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if method is not None:
+                occupancy[name] = method()
+        return {
+            **occupancy,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_sum": self.wait_sum,
+            "wait_max": self.wait_max,
+            "wait_buckets": dict(zip([*map(str, WAIT_BUCKETS), "+Inf"], self.wait_buckets)),
+            "hold_sum": self.hold_sum,
+        }
+
+
+def instrumented_pool(pool_class: Type[Pool], stats: PoolStats) -> Type[Pool]:
+    """Subclass of `pool_class` that records checkout waits and timeouts in `stats`."""
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except exc.TimeoutError:
+                stats.timeouts += 1
+                raise
+            stats.observe_wait(time.perf_counter() - started)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
+
+
+def track_hold_time(sync_engine, stats: PoolStats) -> None:
+    """Add the time each connection stays checked out to `stats.hold_sum`."""
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            stats.hold_sum += time.perf_counter() - started
@@ -0,0 +1,12 @@
+from app.utils.count_cache import count_cache
+from app.utils.response_cache import response_cache
+
+
+def invalidate(*tables: str) -> None:
+    """
+    Invalidate every in-process cache derived from these tables.
+
+    Write handlers call this once after committing.
+    """
+    count_cache.invalidate(*tables)
+    response_cache.invalidate(*tables)
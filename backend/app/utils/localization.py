@@ -0,0 +1,18 @@
+from sqlalchemy import func
+from sqlalchemy.orm import DeclarativeMeta
+
+# Korean is always filled in (the *_ko columns are NOT NULL)
+DEFAULT_LANGUAGE = "ko"
+
+
+def localized(model: DeclarativeMeta, field: str, lang: str):
+    """
+    SQL expression for `field` in `lang`, falling back to Korean.
+
+    Missing or empty translations fall back in the database, so only one
+    language's column value is ever returned to the application.
+    """
+    default = getattr(model, f"{field}_{DEFAULT_LANGUAGE}")
+    if lang == DEFAULT_LANGUAGE:
+        return default.label(field)
+    return func.coalesce(func.nullif(getattr(model, f"{field}_{lang}"), ""), default).label(field)
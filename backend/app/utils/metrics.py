@@ -0,0 +1,188 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.database import get_pool_stats
+from app.utils.hashing import hashing_executor
+
+# Upper bounds of the request latency (seconds) and response size (bytes) histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# Route label of requests that matched no route (keeps label values bounded)
+UNMATCHED_ROUTE = "unmatched"
+
+CONTENT_TYPE = "text/plain; version=0.0.4"  # the response adds "; charset=utf-8"
+
+
+class Histogram:
+    """Bucket counts and sum, in the same shape as the executor and pool stats."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def bucket_counts(self) -> Dict[str, int]:
+        return dict(zip([*map(str, self.buckets), "+Inf"], self.counts))
+
+
+class RequestMetrics:
+    """Per-route request counters, filled in by MetricsMiddleware and QueryProfilerMiddleware."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.sizes: Dict[Tuple[str, str], Histogram] = {}
+        self.queries: Dict[Tuple[str, str], Histogram] = {}
+        self.query_seconds: Dict[Tuple[str, str], float] = {}
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float, size: int) -> None:
+        key = (method, route, status_code)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        if (method, route) not in self.latency:
+            self.latency[(method, route)] = Histogram(LATENCY_BUCKETS)
+            self.sizes[(method, route)] = Histogram(SIZE_BUCKETS)
+        self.latency[(method, route)].observe(seconds)
+        self.sizes[(method, route)].observe(size)
+
+    def observe_queries(self, method: str, route: str, count: int, seconds: float) -> None:
+        """Number of SQL statements one request ran, and their total time."""
+        key = (method, route)
+        if key not in self.queries:
+            self.queries[key] = Histogram(QUERY_COUNT_BUCKETS)
+            self.query_seconds[key] = 0.0
+        self.queries[key].observe(count)
+        self.query_seconds[key] += seconds
+
+
+request_metrics = RequestMetrics()
+
+
+# ============ Prometheus text format ============
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, object]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class MetricsWriter:
+    """Accumulates metric families and renders them in the Prometheus text format."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, object]] = None) -> None:
+        self.lines.append(f"{name}{_format_labels(labels or {})} {_format_value(value)}")
+
+    def histogram(self, name: str, buckets: Dict[str, int], total: float, labels: Optional[Dict[str, object]] = None) -> None:
+        """`buckets` maps each upper bound to the count of that bucket alone (not cumulative)."""
+        labels = labels or {}
+        cumulative = 0
+        for bound, count in buckets.items():
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, {**labels, "le": bound})
+        self.sample(f"{name}_sum", total, labels)
+        self.sample(f"{name}_count", cumulative, labels)
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def _write_requests(writer: MetricsWriter) -> None:
+    writer.family("http_requests_in_flight", "gauge", "Requests currently being served.")
+    writer.sample("http_requests_in_flight", request_metrics.in_flight)
+
+    writer.family("http_requests_total", "counter", "Requests served, by route template and status.")
+    for (method, route, status_code), count in sorted(request_metrics.requests.items()):
+        writer.sample("http_requests_total", count, {"method": method, "route": route, "status": status_code})
+
+    writer.family("http_request_duration_seconds", "histogram", "Time to serve a request, including the body.")
+    for (method, route), histogram in sorted(request_metrics.latency.items()):
+        writer.histogram("http_request_duration_seconds", histogram.bucket_counts(), histogram.sum,
+                         {"method": method, "route": route})
+
+    writer.family("http_response_size_bytes", "histogram", "Response body size.")
+    for (method, route), histogram in sorted(request_metrics.sizes.items()):
+        writer.histogram("http_response_size_bytes", histogram.bucket_counts(), histogram.sum,
+                         {"method": method, "route": route})
+
+    if request_metrics.queries:
+        writer.family("http_request_db_queries", "histogram", "SQL statements run per request.")
+        for (method, route), histogram in sorted(request_metrics.queries.items()):
+            writer.histogram("http_request_db_queries", histogram.bucket_counts(), histogram.sum,
+                             {"method": method, "route": route})
+
+        writer.family("http_request_db_seconds_total", "counter", "Time spent running SQL, by route.")
+        for (method, route), seconds in sorted(request_metrics.query_seconds.items()):
+            writer.sample("http_request_db_seconds_total", seconds, {"method": method, "route": route})
+
+
+def _write_pools(writer: MetricsWriter) -> None:
+    pools = get_pool_stats()
+    gauges = (
+        ("size", "Configured pool size."),
+        ("checkedout", "Connections currently checked out."),
+        ("checkedin", "Idle connections in the pool."),
+        ("overflow", "Connections opened beyond the pool size (negative while below it)."),
+    )
+    for field, help_text in gauges:
+        writer.family(f"db_pool_{field}", "gauge", help_text)
+        for pool, stats in pools.items():
+            if field in stats:
+                writer.sample(f"db_pool_{field}", stats[field], {"pool": pool})
+
+    writer.family("db_pool_timeouts_total", "counter", "Checkouts that gave up waiting for a connection.")
+    for pool, stats in pools.items():
+        writer.sample("db_pool_timeouts_total", stats["timeouts"], {"pool": pool})
+
+    writer.family("db_pool_checkout_wait_seconds", "histogram", "Time spent getting a connection from the pool.")
+    for pool, stats in pools.items():
+        writer.histogram("db_pool_checkout_wait_seconds", stats["wait_buckets"], stats["wait_sum"], {"pool": pool})
+
+    writer.family("db_pool_hold_seconds_total", "counter", "Total time connections were kept checked out.")
+    for pool, stats in pools.items():
+        writer.sample("db_pool_hold_seconds_total", stats["hold_sum"], {"pool": pool})
+
+
+def _write_hashing(writer: MetricsWriter) -> None:
+    stats = hashing_executor.stats()
+    for field, kind, help_text in (
+        ("workers", "gauge", "bcrypt worker threads."),
+        ("in_flight", "gauge", "bcrypt calls running or queued."),
+        ("queue_depth", "gauge", "bcrypt calls waiting for a free worker."),
+        ("rejected", "counter", "bcrypt calls refused with 503 because the queue was full."),
+    ):
+        name = f"password_hash_{field}" + ("_total" if kind == "counter" else "")
+        writer.family(name, kind, help_text)
+        writer.sample(name, stats[field])
+
+    writer.family("password_hash_duration_seconds", "histogram", "bcrypt call latency, including time queued.")
+    writer.histogram("password_hash_duration_seconds", stats["latency_buckets"], stats["latency_sum"])
+
+
+def render_metrics() -> str:
+    """Every metric in the Prometheus text exposition format."""
+    writer = MetricsWriter()
+    _write_requests(writer)
+    _write_pools(writer)
+    _write_hashing(writer)
+    return writer.render()
@@ -1,40 +1,193 @@
-from sqlalchemy.orm import Query
-from typing import TypeVar, Generic, List
+import base64
+import binascii
+import json
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, Select, and_, func, or_, select, type_coerce, String
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from typing import TypeVar, Generic, List, Literal, Optional, Sequence, Tuple
 from math import ceil
+from app.utils.count_cache import count_cache
 
 T = TypeVar('T')
 
+# A listing's sort order as (column, descending) pairs. The last key must be
+# unique (normally the primary key) so that every row has a distinct position.
+SortKey = Tuple[InstrumentedAttribute, bool]
 
-def paginate(query: Query, page: int = 1, limit: int = 10) -> dict:
+# How `total` is computed: "exact" (cached until the table is written),
+# "estimate" (a recent cached count, possibly outdated) or "none" (skipped).
+CountMode = Literal["exact", "estimate", "none"]
+
+
+def _raw(column: InstrumentedAttribute):
+    """
+    Column expression used for cursor values.
+
+    DateTime columns are read and compared as their stored text: SQLite keeps
+    server-default timestamps without microseconds, so a round trip through
+    Python datetimes would not compare equal to the stored value.
+    """
+    if isinstance(column.type, DateTime):
+        return type_coerce(column, String)
+    return column
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Encode sort key values as an opaque URL-safe cursor."""
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """Decode a cursor produced by encode_cursor()."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, ValueError, UnicodeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != length:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return values
+
+
+def _seek_condition(keyset: Sequence[SortKey], values: list, forward: bool):
+    """
+    Build the row-value comparison "position > cursor" for a mixed-direction keyset.
+
+    The leading key gets a plain range bound so the index can seek to it; the
+    remaining keys break ties.
+    """
+    def strictly_after(index: int):
+        column, descending = keyset[index]
+        expr, value = _raw(column), values[index]
+        after = expr < value if descending == forward else expr > value
+        if index == len(keyset) - 1:
+            return after
+        return or_(after, and_(expr == value, strictly_after(index + 1)))
+
+    column, descending = keyset[0]
+    expr, value = _raw(column), values[0]
+    bound = expr <= value if descending == forward else expr >= value
+    return and_(bound, strictly_after(0))
+
+
+def _order_by(keyset: Sequence[SortKey], forward: bool = True) -> list:
+    return [
+        column.desc() if descending == forward else column.asc()
+        for column, descending in keyset
+    ]
+
+
+async def _count(db: AsyncSession, query: Select, mode: CountMode) -> Optional[int]:
+    if mode == "none":
+        return None
+
+    total = count_cache.get(query, allow_stale=mode == "estimate")
+    if total is None:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total = (await db.execute(count_query)).scalar_one()
+        count_cache.set(query, total)
+    return total
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    page: int = 1,
+    limit: int = 10,
+    keyset: Optional[Sequence[SortKey]] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    count: CountMode = "exact"
+) -> dict:
     """
-    Paginate a SQLAlchemy query.
+    Paginate a SQLAlchemy select statement.
+
+    With only `page`, rows are fetched with OFFSET. Passing an `after` or
+    `before` cursor switches to keyset mode, which seeks straight to the
+    cursor position and stays stable while rows are inserted. Either way the
+    result carries `next_cursor`/`prev_cursor` for the neighbouring pages.
+
+    The total is served from the count cache; `count` trades its accuracy
+    for speed (see CountMode). With "none", `total` and `total_pages` are None.
+
+    A query selecting one entity yields its objects as items; a query
+    selecting several columns yields the column tuples.
 
     Args:
-        query: SQLAlchemy query object
-        page: Page number (1-indexed)
+        db: Async database session
+        query: SQLAlchemy select statement (unordered; `keyset` sets the order)
+        page: Page number (1-indexed), ignored in cursor mode
         limit: Items per page
+        keyset: Sort order as (column, descending) pairs, ending in a unique key
+        after: Cursor of the row to start after
+        before: Cursor of the row to end before
+        count: How to compute the total (exact, estimate or none)
 
     Returns:
-        Dictionary with items, total, page, limit, total_pages
+        Dictionary with items, total, page, limit, total_pages, next_cursor, prev_cursor
     """
     # Ensure valid page and limit
     page = max(1, page)
     limit = min(100, max(1, limit))
 
+    if keyset is None:
+        keyset = []
+    if (after or before) and not keyset:
+        raise ValueError("Cursor pagination requires a keyset")
+
     # Get total count
-    total = query.count()
+    total = await _count(db, query, count)
 
     # Calculate total pages
-    total_pages = ceil(total / limit) if total > 0 else 1
+    total_pages = None
+    if total is not None:
+        total_pages = ceil(total / limit) if total > 0 else 1
+
+    width = len(query.column_descriptions)
+    key_columns = [_raw(column).label(f"_cursor_{i}") for i, (column, _) in enumerate(keyset)]
+    query = query.add_columns(*key_columns)
+
+    if after or before:
+        forward = before is None
+        values = decode_cursor(after if forward else before, len(keyset))
+        query = query.where(_seek_condition(keyset, values, forward))
+        rows = (await db.execute(query.order_by(*_order_by(keyset, forward)).limit(limit + 1))).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not forward:
+            rows.reverse()
+        has_next = has_more if forward else True
+        has_prev = True if forward else has_more
+        page = None
+    else:
+        # Get items for current page
+        offset = (page - 1) * limit
+        rows = (await db.execute(query.order_by(*_order_by(keyset)).offset(offset).limit(limit + 1))).all()
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        has_prev = page > 1
 
-    # Get items for current page
-    offset = (page - 1) * limit
-    items = query.offset(offset).limit(limit).all()
+    items = [row[0] for row in rows] if width == 1 else [tuple(row[:width]) for row in rows]
+    next_cursor = prev_cursor = None
+    if keyset and rows:
+        if has_next:
+            next_cursor = encode_cursor(rows[-1][width:])
+        if has_prev:
+            prev_cursor = encode_cursor(rows[0][width:])
 
     return {
         "items": items,
         "total": total,
         "page": page,
         "limit": limit,
-        "total_pages": total_pages
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor
     }
@@ -0,0 +1,111 @@
+import logging
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# A parenthesised list of bound parameters, e.g. the expansion of `IN (...)`
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def statement_shape(statement: str) -> str:
+    """
+    The statement with parameter lists collapsed, so `IN (?, ?)` and
+    `IN (?, ?, ?)` count as the same query when looking for repeats.
+    """
+    return _WHITESPACE.sub(" ", _PARAMETER_LIST.sub("(?)", statement)).strip()
+
+
+class QueryProfile:
+    """SQL statements issued while serving one request."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.duration += seconds
+        shape = statement_shape(statement)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes run more than `threshold` times, most frequent first."""
+        return sorted(
+            ((shape, count) for shape, count in self.shapes.items() if count > threshold),
+            key=lambda item: item[1], reverse=True
+        )
+
+    def warn_repeated(self) -> None:
+        for shape, count in self.repeated(settings.REPEATED_QUERY_THRESHOLD):
+            logger.warning("Possible N+1: %s ran the same statement %d times: %s", self.label, count, shape)
+
+
+# Profile of the request being served; None outside requests (scripts, background flushes)
+current_profile: ContextVar[Optional[QueryProfile]] = ContextVar("current_profile", default=None)
+
+
+def _query_plan(conn, statement: str, parameters) -> List[str]:
+    """
+    EXPLAIN QUERY PLAN of a statement, one line per step, indented by depth.
+
+    Runs on a raw DBAPI cursor of the same connection, so it sees the same
+    transaction and is not itself profiled.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        depths: Dict[int, int] = {}
+        lines = []
+        for step_id, parent, _, detail in cursor.fetchall():
+            depths[step_id] = depths.get(parent, -1) + 1
+            lines.append("  " * depths[step_id] + detail)
+        return lines
+    finally:
+        cursor.close()
+
+
+def _log_slow_query(conn, statement: str, parameters, executemany: bool, seconds: float) -> None:
+    profile = current_profile.get()
+    source = f" in {profile.label}" if profile is not None else ""
+    plan = ""
+    if conn.dialect.name == "sqlite" and not executemany:
+        try:
+            plan = "".join(f"\n{line}" for line in _query_plan(conn, statement, parameters))
+        except Exception as exc:  # e.g. statements EXPLAIN does not accept
+            plan = f"\n(query plan unavailable: {exc})"
+    # Parameters are left out: they can hold personal data and password hashes
+    logger.warning("Slow query (%.1f ms)%s: %s%s", seconds * 1000, source, statement, plan)
+
+
+def install_query_profiler(sync_engine) -> None:
+    """
+    Time every statement run on `sync_engine`.
+
+    Each statement is added to the current request's QueryProfile, and any
+    slower than SLOW_QUERY_THRESHOLD_MS is logged with its query plan.
+    """
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context.query_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - context.query_started_at
+        profile = current_profile.get()
+        if profile is not None:
+            profile.record(statement, seconds)
+        if seconds * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+            _log_slow_query(conn, statement, parameters, executemany, seconds)
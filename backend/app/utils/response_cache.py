@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from app.config import settings
+
+
+class ResponseCache:
+    """
+    LRU cache of serialized JSON response bodies with TTL and tag invalidation.
+
+    Entries hold the final response bytes, so a hit skips both SQL and
+    Pydantic; any headers passed to ``store()`` (e.g. ETag) are replayed
+    with it. Each entry is tagged with the tables it was built from
+    (e.g. "posts", "services"); write handlers purge a tag with
+    ``invalidate()``.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[bytes, Tuple[str, ...], float, Dict[str, str]]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+
+    def get(self, key: Hashable) -> Optional[Response]:
+        """Return a response for a cached body, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        body, _, expires_at, headers = entry
+        if time.monotonic() > expires_at:
+            self._discard(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def store(
+        self,
+        key: Hashable,
+        content: Any,
+        tags: Iterable[str],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        """
+        Serialize `content` like FastAPI would, cache the bytes and return the response.
+        `content` may also be an already-encoded JSON body (bytes).
+        """
+        headers = dict(headers or {})
+        if isinstance(content, bytes):
+            response = Response(content=content, media_type="application/json", headers=headers)
+        else:
+            response = JSONResponse(content=jsonable_encoder(content), headers=headers)
+        tags = tuple(tags)
+
+        self._discard(key)
+        self._entries[key] = (response.body, tags, time.monotonic() + self.ttl, headers)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+        return response
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every entry carrying any of these tags."""
+        for tag in tags:
+            for key in self._tags.pop(tag, set()):
+                self._discard(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[1]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+
+
+response_cache = ResponseCache(ttl=settings.RESPONSE_CACHE_TTL)
@@ -0,0 +1,58 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Sequence, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+
+@lru_cache(maxsize=None)
+def _as_typed_dict(model: Type[BaseModel]) -> type:
+    """A TypedDict with the fields of `model`, in the same order."""
+    return TypedDict(model.__name__, {
+        name: _plain(field.annotation) for name, field in model.model_fields.items()
+    })
+
+
+def _plain(annotation: Any) -> Any:
+    """Replace response models inside a type annotation with equivalent TypedDicts."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _as_typed_dict(annotation)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is None or not args:
+        return annotation
+    if origin in (list, List):
+        return List[_plain(args[0])]
+    if origin is Union:
+        return Union[tuple(_plain(arg) for arg in args)]
+    return annotation
+
+
+class ResponseEncoder:
+    """
+    Encodes plain dicts straight to JSON bytes in the shape of a response model.
+
+    The serializer is compiled once from the model's schema, so list
+    endpoints can skip building a model instance per row (and the second
+    pass through `jsonable_encoder`). Values are not validated: they must
+    already have the field types, as column values read from the database
+    do. Keys are written in the order of the dict, and keys the model does
+    not declare are dropped.
+    """
+
+    def __init__(self, annotation: Any):
+        self._adapter = TypeAdapter(_plain(annotation))
+
+    def encode(self, data: Any) -> bytes:
+        return self._adapter.dump_json(data)
+
+
+def model_columns(entity, model: Type[BaseModel]) -> List:
+    """Mapped columns of `entity` for the fields of `model` that are stored (in field order)."""
+    columns = entity.__table__.columns
+    return [getattr(entity, name) for name in model.model_fields if name in columns]
+
+
+def rows_to_dicts(rows: Iterable[Sequence], columns: Sequence, **extra: Any) -> List[Dict[str, Any]]:
+    """Column tuples as dicts keyed by column name, with `extra` keys appended to each."""
+    names = [column.key for column in columns]
+    return [{**dict(zip(names, row)), **extra} for row in rows]
@@ -0,0 +1,268 @@
+import os
+import re
+import stat
+import threading
+from collections import OrderedDict
+from email.utils import parsedate
+from mimetypes import guess_type
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.config import settings
+
+# Content-addressed uploads and their variants never change under the same name
+HASHED_NAME = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(-\d+w)?\.[a-z0-9]+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, no-cache"
+
+# Precompressed siblings, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class FileCache:
+    """
+    Byte-bounded LRU of small file bodies.
+
+    Keys include the file's mtime and size, so a replaced file is never
+    served stale; the old entry just ages out.
+    """
+
+    def __init__(self, max_bytes: int, max_file_size: int):
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, stat_result: os.stat_result) -> Tuple[str, int, int]:
+        return path, stat_result.st_mtime_ns, stat_result.st_size
+
+    def cacheable(self, stat_result: os.stat_result) -> bool:
+        return stat_result.st_size <= self.max_file_size
+
+    def get(self, key: Tuple[str, int, int]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key: Tuple[str, int, int], body: bytes) -> None:
+        if len(body) > self.max_file_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+file_cache = FileCache(
+    max_bytes=settings.UPLOAD_CACHE_MAX_BYTES,
+    max_file_size=settings.UPLOAD_CACHE_MAX_FILE_SIZE
+)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    The (start, end) inclusive byte range a Range header asks for.
+
+    Returns None when the whole file should be sent (no header, several
+    ranges, or a unit other than bytes); raises ValueError when the range
+    cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = RANGE.match(header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if not first:
+        if not last or int(last) == 0:
+            raise ValueError(header)
+        # Suffix range: the last N bytes
+        return max(0, size - int(last)), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise ValueError(header)
+    return start, end
+
+
+class UploadFileResponse(FileResponse):
+    """
+    FileResponse with single byte-range support, an in-memory cache of small
+    files, and zero-copy sends where the server offers them.
+    """
+
+    def __init__(self, *args, byte_range: Optional[Tuple[int, int]] = None, cache: Optional[FileCache] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.byte_range = byte_range
+        self.cache = cache
+        self.headers["accept-ranges"] = "bytes"
+        if byte_range is not None:
+            start, end = byte_range
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {start}-{end}/{self.stat_result.st_size}"
+            self.headers["content-length"] = str(end - start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        size = self.stat_result.st_size
+        start, end = self.byte_range if self.byte_range is not None else (0, size - 1)
+        count = end - start + 1
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"].upper() == "HEAD" or count <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if self.cache is not None and self.cache.cacheable(self.stat_result):
+            key = FileCache.key(str(self.path), self.stat_result)
+            body = self.cache.get(key)
+            if body is None:
+                body = await anyio.Path(self.path).read_bytes()
+                self.cache.set(key, body)
+            await send({"type": "http.response.body", "body": body[start:end + 1], "more_body": False})
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                # The server copies straight from the file descriptor (sendfile)
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file.wrapped.fileno(),
+                    "offset": start,
+                    "count": count,
+                    "more_body": False,
+                })
+                return
+
+            await file.seek(start)
+            remaining = count
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # File shrank underneath us; end the body rather than hang
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class UploadFiles(StaticFiles):
+    """
+    StaticFiles for UPLOAD_DIR tuned for browser and proxy caching.
+
+    - Content-addressed names get a year-long `immutable` Cache-Control;
+      anything else must be revalidated.
+    - A `.br` / `.gz` sibling is served instead of the file when the client
+      accepts that encoding (not for range requests).
+    - Single byte ranges are answered with 206, with If-Range honoured.
+    - Small files are kept in an in-memory LRU; large ones are streamed, or
+      handed to the server for sendfile when it supports zero-copy sends.
+    """
+
+    def __init__(self, *args, cache: Optional[FileCache] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        relative = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        range_header = request_headers.get("range")
+
+        served_path, served_stat, encoding = str(full_path), stat_result, None
+        if not range_header:
+            served_path, served_stat, encoding = self._precompressed(str(full_path), stat_result, request_headers)
+
+        headers = {
+            "cache-control": IMMUTABLE if HASHED_NAME.match(relative) else REVALIDATE,
+            "vary": "Accept-Encoding",
+        }
+        if encoding is not None:
+            headers["content-encoding"] = encoding
+
+        response = UploadFileResponse(
+            served_path,
+            status_code=status_code,
+            stat_result=served_stat,
+            headers=headers,
+            media_type=guess_type(str(full_path))[0] or "application/octet-stream",
+            cache=self.cache,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+
+        if range_header and self._if_range_matches(request_headers, response.headers):
+            try:
+                byte_range = parse_range(range_header, served_stat.st_size)
+            except ValueError:
+                return Response(status_code=416, headers={"content-range": f"bytes */{served_stat.st_size}"})
+            if byte_range is not None:
+                response = UploadFileResponse(
+                    served_path,
+                    stat_result=served_stat,
+                    headers=headers,
+                    media_type=response.media_type,
+                    cache=self.cache,
+                    byte_range=byte_range,
+                )
+        return response
+
+    @staticmethod
+    def _precompressed(path: str, stat_result: os.stat_result, request_headers: Headers):
+        accepted = {
+            token.split(";")[0].strip().lower()
+            for token in request_headers.get("accept-encoding", "").split(",")
+        }
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            try:
+                sibling_stat = os.stat(path + suffix)
+            except OSError:
+                continue
+            if stat.S_ISREG(sibling_stat.st_mode):
+                return path + suffix, sibling_stat, encoding
+        return path, stat_result, None
+
+    @staticmethod
+    def _if_range_matches(request_headers: Headers, response_headers) -> bool:
+        """A Range applies unless If-Range names a different version of the file."""
+        if_range = request_headers.get("if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            return if_range == response_headers.get("etag")
+        return parsedate(if_range) is not None and parsedate(if_range) == parsedate(response_headers.get("last-modified"))
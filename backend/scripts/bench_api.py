@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Endpoint benchmark and load-test suite.
+
+Seeds a database at a chosen size with the synthetic data generator from
+seed_data.py, starts the app in-process under uvicorn and drives every
+public and admin route in turn with concurrent async clients. For each
+route it reports throughput and p50/p95/p99 latency, and writes the
+results as JSON. Setup requests (e.g. creating the post a DELETE removes)
+are not timed.
+
+Write routes modify the benchmark database; use a scratch one (the
+default) or a copy.
+
+Usage:
+    # run against a fresh 1k-row database and store the results
+    python scripts/bench_api.py run --size 1k --output bench-1k.json
+
+    # reuse a seeded database (seeding 1M rows takes a while)
+    python scripts/bench_api.py run --size 1m --db /tmp/bench-1m.db --output after.json
+
+    # only some routes, more clients, caches disabled
+    python scripts/bench_api.py run --routes "GET /api/posts*" --clients 32 --no-cache
+
+    # flag routes that got slower than the baseline (exit status 1 if any)
+    python scripts/bench_api.py compare before.json after.json [--threshold 0.10]
+
+A route regresses when its p95 latency rises, or its throughput falls, by
+more than the threshold (default 10%).
+"""
+import argparse
+import asyncio
+import fnmatch
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Set
+
+# Add parent directory to path, and this one for seed_data
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Row counts per preset: (posts, services, contacts)
+SIZES = {
+    "1k": (1_000, 50, 1_000),
+    "100k": (100_000, 1_000, 100_000),
+    "1m": (1_000_000, 2_000, 1_000_000),
+}
+
+ADMIN_USERNAME = "bench-admin"
+ADMIN_PASSWORD = "bench-password"
+
+SEARCH_QUERIES = ["비자", "외국인 등록", "visa", "extension", "passport", "签证", "居留"]
+
+# Smallest valid PNG (1x1), for the upload route
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000100e221bc330000000049454e44ae426082"
+)
+
+
+class Context(NamedTuple):
+    """Ids and credentials the request builders draw from."""
+    headers: Dict[str, str]
+    post_ids: List[int]
+    service_ids: List[int]
+    contact_ids: List[int]
+    secret_contact_ids: List[int]
+    post_cursors: List[str]
+
+
+class Route(NamedTuple):
+    name: str
+    # Builds the timed request; may send untimed setup requests first
+    build: Callable[[object, Context], Awaitable[object]]
+    expected: Set[int]
+
+
+def routes() -> List[Route]:
+    """Every benchmarked route, public ones first."""
+    from seed_data import GENERATED_SECRET_PASSWORD
+
+    def get(path, params=None, auth=False):
+        async def build(client, ctx):
+            return client.build_request(
+                "GET", path(ctx) if callable(path) else path,
+                params=params(ctx) if callable(params) else params,
+                headers=ctx.headers if auth else None
+            )
+        return build
+
+    def send(method, path, body, auth=True, content_type=None):
+        async def build(client, ctx):
+            headers = dict(ctx.headers) if auth else {}
+            if content_type:
+                headers["Content-Type"] = content_type
+                return client.build_request(method, path(ctx) if callable(path) else path,
+                                            content=body(ctx), headers=headers)
+            return client.build_request(method, path(ctx) if callable(path) else path,
+                                        json=body(ctx) if callable(body) else body, headers=headers)
+        return build
+
+    def created_then_deleted(create_path, delete_path, body):
+        async def build(client, ctx):
+            response = await client.post(create_path, json=body, headers=ctx.headers)
+            response.raise_for_status()
+            return client.build_request("DELETE", f"{delete_path}/{response.json()['id']}", headers=ctx.headers)
+        return build
+
+    async def upload(client, ctx):
+        return client.build_request("POST", "/api/admin/upload", files={"file": ("bench.png", PNG, "image/png")},
+                                    headers=ctx.headers)
+
+    post = {"title_ko": "벤치마크 게시글", "title_en": "Benchmark post", "content_ko": "본문 " * 200, "is_public": True}
+    service = {"title_ko": "벤치마크 서비스", "description_ko": "설명 " * 50, "is_published": True}
+    contact = {"name": "벤치마크", "contact": "010-0000-0000", "message": "문의 " * 40}
+    imported = "\n".join(json.dumps({**contact, "message": f"import {i}"}) for i in range(100)).encode()
+
+    return [
+        # Public
+        Route("GET /api/home", get("/api/home"), {200}),
+        Route("GET /api/posts", get("/api/posts", lambda ctx: {"page": random.randint(1, 50)}), {200}),
+        Route("GET /api/posts?after", get("/api/posts", lambda ctx: {"after": random.choice(ctx.post_cursors), "count": "none"}), {200}),
+        Route("GET /api/posts/{id}", get(lambda ctx: f"/api/posts/{random.choice(ctx.post_ids)}"), {200}),
+        Route("GET /api/posts/{id}?lang", get(lambda ctx: f"/api/posts/{random.choice(ctx.post_ids)}", {"lang": "en"}), {200}),
+        Route("GET /api/services", get("/api/services", lambda ctx: {"page": random.randint(1, 10)}), {200}),
+        Route("GET /api/services/featured", get("/api/services/featured"), {200}),
+        Route("GET /api/services/{id}", get(lambda ctx: f"/api/services/{random.choice(ctx.service_ids)}"), {200}),
+        Route("GET /api/search", get("/api/search", lambda ctx: {"q": random.choice(SEARCH_QUERIES)}), {200}),
+        Route("GET /api/contacts", get("/api/contacts", lambda ctx: {"page": random.randint(1, 50)}), {200}),
+        Route("GET /api/contacts/{id}", get(lambda ctx: f"/api/contacts/{random.choice(ctx.contact_ids)}"), {200}),
+        Route("POST /api/contacts", send("POST", "/api/contacts", contact, auth=False), {201}),
+        Route("POST /api/contacts/{id}/verify", send(
+            "POST", lambda ctx: f"/api/contacts/{random.choice(ctx.secret_contact_ids)}/verify",
+            lambda ctx: {"password": GENERATED_SECRET_PASSWORD}, auth=False
+        ), {200}),
+        Route("POST /api/auth/login", send(
+            "POST", "/api/auth/login", {"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}, auth=False
+        ), {200}),
+        Route("GET /api/auth/me", get("/api/auth/me", auth=True), {200}),
+        # Admin
+        Route("GET /api/admin/dashboard", get("/api/admin/dashboard", auth=True), {200}),
+        Route("GET /api/admin/system", get("/api/admin/system", auth=True), {200}),
+        Route("GET /api/admin/posts", get("/api/admin/posts", lambda ctx: {"page": random.randint(1, 50)}, auth=True), {200}),
+        Route("GET /api/admin/services", get("/api/admin/services", auth=True), {200}),
+        Route("GET /api/admin/contacts", get("/api/admin/contacts", lambda ctx: {"page": random.randint(1, 50)}, auth=True), {200}),
+        Route("GET /api/admin/contacts/{id}", get(lambda ctx: f"/api/admin/contacts/{random.choice(ctx.contact_ids)}", auth=True), {200}),
+        Route("PUT /api/admin/contacts/{id}/reply", send(
+            "PUT", lambda ctx: f"/api/admin/contacts/{random.choice(ctx.contact_ids)}/reply",
+            {"admin_reply": "답변 " * 30}
+        ), {200}),
+        Route("DELETE /api/admin/contacts/{id}", created_then_deleted("/api/contacts", "/api/admin/contacts", contact), {204}),
+        Route("POST /api/posts", send("POST", "/api/posts", post), {201}),
+        Route("PUT /api/posts/{id}", send(
+            "PUT", lambda ctx: f"/api/posts/{random.choice(ctx.post_ids)}", {"title_en": "Benchmark edit"}
+        ), {200}),
+        Route("DELETE /api/posts/{id}", created_then_deleted("/api/posts", "/api/posts", post), {204}),
+        Route("POST /api/services", send("POST", "/api/services", service), {201}),
+        Route("PUT /api/services/{id}", send(
+            "PUT", lambda ctx: f"/api/services/{random.choice(ctx.service_ids)}", {"icon": "FileText"}
+        ), {200}),
+        Route("DELETE /api/services/{id}", created_then_deleted("/api/services", "/api/services", service), {204}),
+        Route("POST /api/admin/bulk/contacts", send(
+            "POST", "/api/admin/bulk/contacts",
+            lambda ctx: {"action": "mark_read", "ids": random.sample(ctx.contact_ids, min(100, len(ctx.contact_ids)))}
+        ), {200}),
+        Route("GET /api/admin/export/services", get("/api/admin/export/services", auth=True), {200}),
+        Route("POST /api/admin/import/contacts", send(
+            "POST", "/api/admin/import/contacts", lambda ctx: imported, content_type="application/x-ndjson"
+        ), {200}),
+        Route("POST /api/admin/upload", upload, {200}),
+    ]
+
+
+# ============ Setup ============
+
+def prepare_database(posts: int, services: int, contacts: int, seed: Optional[int]) -> None:
+    """Seed the database unless it already has data, and make sure the admin exists."""
+    from sqlalchemy import func, select
+    from app.database import Base, SessionLocal, engine
+    from app.models.admin import Admin
+    from app.models.post import Post
+    from app.utils.security import get_password_hash
+    from seed_data import generate
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        existing = db.scalar(select(func.count()).select_from(Post))
+        if existing:
+            print(f"Using the existing database ({existing} posts)")
+        else:
+            generate(posts, services, contacts, batch_size=5000, seed=seed)
+        if db.scalar(select(Admin).where(Admin.username == ADMIN_USERNAME)) is None:
+            db.add(Admin(username=ADMIN_USERNAME, hashed_password=get_password_hash(ADMIN_PASSWORD)))
+            db.commit()
+
+
+def sample_ids(limit: int = 10_000) -> Dict[str, List[int]]:
+    """Random ids to request, drawn from rows the public routes can return."""
+    from sqlalchemy import func, select
+    from app.database import SessionLocal
+    from app.models.contact import Contact
+    from app.models.post import Post
+    from app.models.service import Service
+
+    def ids(query):
+        return list(db.scalars(query.order_by(func.random()).limit(limit)))
+
+    with SessionLocal() as db:
+        return {
+            "post_ids": ids(select(Post.id).where(Post.is_public == True)),
+            "service_ids": ids(select(Service.id).where(Service.is_published == True)),
+            "contact_ids": ids(select(Contact.id).where(Contact.is_secret == False)),
+            "secret_contact_ids": ids(select(Contact.id).where(Contact.is_secret == True)),
+        }
+
+
+async def collect_cursors(client, pages: int = 20) -> List[str]:
+    """`next_cursor` values of the first pages of the public post listing."""
+    cursors, cursor = [], None
+    for _ in range(pages):
+        params = {"after": cursor} if cursor else {}
+        cursor = (await client.get("/api/posts", params=params)).json().get("next_cursor")
+        if not cursor:
+            break
+        cursors.append(cursor)
+    return cursors
+
+
+# ============ Measurement ============
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+async def measure(client, route: Route, ctx: Context, clients: int, duration: float) -> Dict:
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            request = await route.build(client, ctx)
+            started = time.perf_counter()
+            response = await client.send(request)
+            await response.aread()
+            latencies.append(time.perf_counter() - started)
+            if response.status_code not in route.expected:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "mean_ms": sum(ms) / len(ms) if ms else 0.0,
+        "p50_ms": percentile(ms, 0.50),
+        "p95_ms": percentile(ms, 0.95),
+        "p99_ms": percentile(ms, 0.99),
+        "max_ms": ms[-1] if ms else 0.0,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> Dict:
+    import httpx
+    import uvicorn
+
+    posts, services, contacts = SIZES[args.size]
+    prepare_database(posts, services, contacts, args.seed)
+    sampled = sample_ids()
+
+    selected = [route for route in routes() if any(fnmatch.fnmatch(route.name, pattern) for pattern in args.routes)]
+    if not selected:
+        sys.exit(f"No route matches {args.routes}")
+
+    server = uvicorn.Server(uvicorn.Config("app.main:app", host="127.0.0.1", port=args.port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    results: Dict[str, Dict] = {}
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=60) as client:
+            login = await client.post("/api/auth/login", json={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD})
+            login.raise_for_status()
+            ctx = Context(
+                headers={"Authorization": f"Bearer {login.json()['access_token']}"},
+                post_cursors=await collect_cursors(client) or [""],
+                **sampled
+            )
+
+            print(f"{'route':<40} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+            for route in selected:
+                if args.warmup:
+                    await measure(client, route, ctx, args.clients, args.warmup)
+                result = results[route.name] = await measure(client, route, ctx, args.clients, args.duration)
+                print(f"{route.name:<40} {result['throughput']:>9.1f} {result['p50_ms']:>8.2f} "
+                      f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} {sum(result['errors'].values()):>7}")
+    finally:
+        server.should_exit = True
+        await server_task
+
+    return {
+        "meta": {
+            "size": args.size,
+            "rows": {"posts": posts, "services": services, "contacts": contacts},
+            "clients": args.clients,
+            "duration": args.duration,
+            "cache": not args.no_cache,
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        },
+        "routes": results,
+    }
+
+
+# ============ Comparison ============
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> bool:
+    """Print per-route changes; return True if any route regressed."""
+    regressed = False
+    print(f"{'route':<40} {'req/s':>17} {'p95 ms':>19}")
+    for name, now in current["routes"].items():
+        before = baseline["routes"].get(name)
+        if before is None:
+            print(f"{name:<40} {'(new route)':>17}")
+            continue
+        throughput_change = now["throughput"] / before["throughput"] - 1 if before["throughput"] else 0.0
+        latency_change = now["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        flag = ""
+        if throughput_change < -threshold or latency_change > threshold:
+            flag, regressed = "  REGRESSION", True
+        elif throughput_change > threshold or latency_change < -threshold:
+            flag = "  improved"
+        print(f"{name:<40} {now['throughput']:>9.1f} {throughput_change:>+7.1%} "
+              f"{now['p95_ms']:>10.2f} {latency_change:>+7.1%}{flag}")
+    for name in baseline["routes"].keys() - current["routes"].keys():
+        print(f"{name:<40} {'(not run)':>17}")
+    for key in ("size", "clients", "duration", "cache"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"warning: {key} differs ({baseline['meta'].get(key)} vs {current['meta'].get(key)})")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="seed, benchmark every route and write JSON results")
+    run_parser.add_argument("--size", choices=SIZES, default="1k")
+    run_parser.add_argument("--db", help="SQLite file to use (seeded only if it has no posts)")
+    run_parser.add_argument("--routes", nargs="+", default=["*"], help="route name patterns, e.g. 'GET /api/posts*'")
+    run_parser.add_argument("--clients", type=int, default=16)
+    run_parser.add_argument("--duration", type=float, default=5.0, help="seconds per route")
+    run_parser.add_argument("--warmup", type=float, default=1.0, help="untimed seconds per route before measuring")
+    run_parser.add_argument("--no-cache", action="store_true", help="disable the response and count caches")
+    run_parser.add_argument("--seed", type=int, default=1, help="random seed of the generated data")
+    run_parser.add_argument("--port", type=int, default=9102)
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.add_argument("--baseline", help="compare against this results file when done")
+    run_parser.add_argument("--threshold", type=float, default=0.10)
+
+    compare_parser = commands.add_parser("compare", help="compare two results files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        sys.exit(1 if compare(baseline, current, args.threshold) else 0)
+
+    # Point the app at the benchmark database before any app module is imported
+    tmpdir = tempfile.mkdtemp(prefix="blog-bench-api-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(args.db) if args.db else os.path.join(tmpdir, 'bench.db')}"
+    os.environ["UPLOAD_DIR"] = os.path.join(tmpdir, "uploads")
+    os.makedirs(os.environ["UPLOAD_DIR"], exist_ok=True)
+    if args.no_cache:
+        os.environ["RESPONSE_CACHE_TTL"] = "0"
+        os.environ["COUNT_CACHE_TTL"] = "0"
+
+    results = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print()
+        sys.exit(1 if compare(baseline, results, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the public API.
+
+Starts the app in-process under uvicorn against a throwaway SQLite database,
+then drives it with an increasing number of concurrent clients and reports
+requests per second at each level. With the async database layer, throughput
+should keep growing as clients are added instead of flattening at one
+request's worth of latency.
+
+Usage:
+    python scripts/bench_concurrency.py [--posts 2000] [--duration 5] [--levels 1,2,4,8,16,32]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Point the app at a scratch database before any app module is imported
+_tmpdir = tempfile.mkdtemp(prefix="blog-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+os.makedirs(os.environ["UPLOAD_DIR"], exist_ok=True)
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from app.database import Base, engine, SessionLocal  # noqa: E402
+from app.models.post import Post  # noqa: E402
+
+
+def seed(n_posts: int):
+    """Create tables and insert n_posts public posts."""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.add_all([
+            Post(
+                title_ko=f"벤치마크 게시글 {i}",
+                title_en=f"Benchmark post {i}",
+                content_ko="본문 " * 200,
+                content_en="body " * 200,
+                is_public=True
+            )
+            for i in range(n_posts)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_level(client: httpx.AsyncClient, concurrency: int, duration: float, n_posts: int) -> float:
+    """Run `concurrency` clients for `duration` seconds and return requests/sec."""
+    completed = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            if random.random() < 0.5:
+                response = await client.get("/api/posts", params={"page": random.randint(1, 20)})
+            else:
+                response = await client.get(f"/api/posts/{random.randint(1, n_posts)}")
+            response.raise_for_status()
+            completed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return completed / (time.perf_counter() - started)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--levels", default="1,2,4,8,16,32")
+    parser.add_argument("--port", type=int, default=9100)
+    args = parser.parse_args()
+
+    seed(args.posts)
+
+    config = uvicorn.Config("app.main:app", host="127.0.0.1", port=args.port, log_level="warning")
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    levels = [int(level) for level in args.levels.split(",")]
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits) as client:
+            print(f"{'clients':>8} {'req/s':>10}")
+            for concurrency in levels:
+                rps = await run_level(client, concurrency, args.duration, args.posts)
+                print(f"{concurrency:>8} {rps:>10.1f}")
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Per-item cost of building a post list page, old path vs. fast path.
+
+    models   select(Post) ORM objects -> PostListResponse.model_validate per
+             row -> PaginatedPostsResponse -> jsonable_encoder -> JSON
+    columns  select() of the listed columns only -> plain dicts -> bytes via
+             the precompiled ResponseEncoder (what GET /api/posts now does)
+
+Each path is timed twice: encoding an already fetched page, and fetching
+plus encoding it from a seeded SQLite file. Both paths produce the same
+JSON body, which is checked before timing.
+
+Usage:
+    python scripts/bench_serialization.py [--items 100] [--rounds 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmpdir = tempfile.mkdtemp(prefix="blog-bench-serialization-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import Base, engine  # noqa: E402
+from app.models.post import Post, POST_LISTING_ORDER  # noqa: E402
+from app.routers.posts import LIST_COLUMNS, page_encoder  # noqa: E402
+from app.schemas.post import PaginatedPostsResponse, PostListResponse  # noqa: E402
+from app.utils.serialization import rows_to_dicts  # noqa: E402
+
+PAGE = {"total": 1000, "page": 1, "limit": 100, "total_pages": 10, "next_cursor": "WzEsMl0", "prev_cursor": None}
+
+
+def seed(n_posts: int):
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Post), [
+            {
+                "title_ko": f"게시글 {i}",
+                "title_en": f"Post {i}",
+                "content_ko": "본문 " * 500,
+                "content_en": "body " * 500,
+                "thumbnail_url": f"/uploads/{i:064x}.jpg",
+                "is_public": True,
+            }
+            for i in range(n_posts)
+        ])
+
+
+def order_by():
+    return [column.desc() if descending else column for column, descending in POST_LISTING_ORDER]
+
+
+def fetch_models(session: Session, items: int):
+    return session.scalars(select(Post).order_by(*order_by()).limit(items)).all()
+
+
+def fetch_columns(session: Session, items: int):
+    return session.execute(select(*LIST_COLUMNS).order_by(*order_by()).limit(items)).all()
+
+
+def encode_models(posts) -> bytes:
+    page = PaginatedPostsResponse(items=[PostListResponse.model_validate(p) for p in posts], **PAGE)
+    return JSONResponse(content=jsonable_encoder(page)).body
+
+
+def encode_columns(rows) -> bytes:
+    return page_encoder.encode({"items": rows_to_dicts(rows, LIST_COLUMNS, thumbnail_srcset=None), **PAGE})
+
+
+def per_item_us(fn, rounds: int, items: int) -> float:
+    fn()  # warm up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds / items * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    seed(args.items)
+    with Session(engine) as session:
+        posts = fetch_models(session, args.items)
+        rows = fetch_columns(session, args.items)
+        assert encode_models(posts) == encode_columns(rows), "the two paths encode different JSON"
+
+        def models_end_to_end():
+            session.expunge_all()
+            return encode_models(fetch_models(session, args.items))
+
+        results = {
+            "models": (
+                per_item_us(lambda: encode_models(posts), args.rounds, args.items),
+                per_item_us(models_end_to_end, args.rounds, args.items),
+            ),
+            "columns": (
+                per_item_us(lambda: encode_columns(rows), args.rounds, args.items),
+                per_item_us(lambda: encode_columns(fetch_columns(session, args.items)), args.rounds, args.items),
+            ),
+        }
+
+    print(f"{args.items} items/page, {len(encode_columns(rows))} bytes/page")
+    print(f"{'path':>8} {'encode µs/item':>15} {'fetch+encode µs/item':>21}")
+    for name, (encode, total) in results.items():
+        print(f"{name:>8} {encode:>15.2f} {total:>21.2f}")
+    encode_speedup = results["models"][0] / results["columns"][0]
+    total_speedup = results["models"][1] / results["columns"][1]
+    print(f"speedup: {encode_speedup:.1f}x encode, {total_speedup:.1f}x fetch+encode")
+
+
+if __name__ == "__main__":
+    main()
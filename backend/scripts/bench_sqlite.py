@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Concurrent read/write benchmark for the SQLite connection profile.
+
+Runs the same mixed workload twice on fresh database files: once with
+SQLite's defaults (rollback journal, synchronous=FULL, 2MB cache, no mmap)
+and once with the PRAGMAs from Settings that app.database applies to every
+connection. Reader threads page through posts and load single posts while
+writer threads insert contacts and update posts, each write in its own
+transaction. Reports reads/sec, writes/sec and "database is locked" errors.
+
+Usage:
+    python scripts/bench_sqlite.py [--posts 20000] [--readers 8] [--writers 2] [--duration 5]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, select, update  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app.database import Base, install_sqlite_pragmas, sqlite_pragmas  # noqa: E402
+from app.models.contact import Contact  # noqa: E402
+from app.models.post import Post, POST_LISTING_ORDER  # noqa: E402
+
+
+def make_engine(path: str, pragmas):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=32,
+        max_overflow=0
+    )
+    install_sqlite_pragmas(engine, pragmas)
+    return engine
+
+
+def seed(engine, n_posts: int):
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Post), [
+            {"title_ko": f"게시글 {i}", "content_ko": "본문 " * 200, "is_public": True}
+            for i in range(n_posts)
+        ])
+
+
+def run(engine, n_posts: int, readers: int, writers: int, duration: float):
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    order_by = [column.desc() if descending else column for column, descending in POST_LISTING_ORDER]
+
+    def count(key):
+        with lock:
+            counts[key] += 1
+
+    def reader():
+        while time.perf_counter() < deadline:
+            try:
+                with engine.connect() as conn:
+                    if random.random() < 0.5:
+                        conn.execute(select(Post).where(Post.is_public == True).order_by(*order_by)
+                                     .offset(random.randint(0, 200) * 10).limit(10)).all()
+                    else:
+                        conn.execute(select(Post).where(Post.id == random.randint(1, n_posts))).first()
+                count("reads")
+            except OperationalError:
+                count("locked")
+
+    def writer():
+        while time.perf_counter() < deadline:
+            try:
+                with engine.begin() as conn:
+                    if random.random() < 0.5:
+                        conn.execute(insert(Contact).values(name="bench", contact="010", message="hello " * 50))
+                    else:
+                        conn.execute(update(Post).where(Post.id == random.randint(1, n_posts))
+                                     .values(view_count=Post.view_count + 1))
+                count("writes")
+            except OperationalError:
+                count("locked")
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return counts["reads"] / elapsed, counts["writes"] / elapsed, counts["locked"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=20000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="blog-bench-sqlite-")
+    profiles = {"defaults": {}, "settings": sqlite_pragmas()}
+
+    print(f"{'profile':>10} {'reads/s':>10} {'writes/s':>10} {'locked':>8}")
+    for name, pragmas in profiles.items():
+        engine = make_engine(os.path.join(tmpdir, f"{name}.db"), pragmas)
+        seed(engine, args.posts)
+        reads, writes, locked = run(engine, args.posts, args.readers, args.writers, args.duration)
+        engine.dispose()
+        print(f"{name:>10} {reads:>10.1f} {writes:>10.1f} {locked:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for serving /uploads.
+
+Serves the same scratch directory twice under uvicorn, in-process: once
+through a plain StaticFiles mount (the previous setup) and once through
+UploadFiles, the serving layer now mounted by the app. Each scenario is then
+run against both with concurrent clients, and requests/sec and MB/s are
+reported side by side.
+
+Scenarios:
+    small   full GETs of small images (served from the in-memory LRU)
+    large   full GETs of large images (streamed / sendfile)
+    range   1 MB byte ranges of large images
+    revalid conditional GETs (If-None-Match) answered with 304
+
+With UploadFiles, hashed names are sent with `Cache-Control: immutable`,
+so browsers skip the `revalid` requests entirely after the first view.
+
+Usage:
+    python scripts/bench_uploads.py [--duration 5] [--clients 16] [--files 200]
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmpdir = tempfile.mkdtemp(prefix="blog-bench-uploads-")
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+os.makedirs(os.environ["UPLOAD_DIR"], exist_ok=True)
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from starlette.applications import Starlette  # noqa: E402
+from starlette.routing import Mount  # noqa: E402
+from starlette.staticfiles import StaticFiles  # noqa: E402
+
+from app.utils.static_files import UploadFiles, file_cache  # noqa: E402
+
+SMALL_SIZE = 24 * 1024
+LARGE_SIZE = 4 * 1024 * 1024
+
+
+def write_files(count: int):
+    """Write `count` small and a few large content-addressed files; return their relative paths."""
+    def store(data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = f"{digest[:2]}/{digest[2:4]}/{digest}.jpg"
+        full_path = os.path.join(os.environ["UPLOAD_DIR"], path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(data)
+        return path
+
+    small = [store(os.urandom(SMALL_SIZE)) for _ in range(count)]
+    large = [store(os.urandom(LARGE_SIZE)) for _ in range(max(1, count // 50))]
+    return small, large
+
+
+async def run(client: httpx.AsyncClient, clients: int, duration: float, make_request):
+    """Run `clients` workers for `duration` seconds; return (req/s, MB/s)."""
+    completed = 0
+    received = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal completed, received
+        while time.perf_counter() < deadline:
+            path, headers, expected = make_request()
+            response = await client.get(path, headers=headers)
+            assert response.status_code == expected, (path, response.status_code)
+            completed += 1
+            received += len(response.content)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    return completed / elapsed, received / elapsed / 1024 / 1024
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--port", type=int, default=9101)
+    args = parser.parse_args()
+
+    small, large = write_files(args.files)
+    directory = os.environ["UPLOAD_DIR"]
+    app = Starlette(routes=[
+        Mount("/plain", StaticFiles(directory=directory)),
+        Mount("/uploads", UploadFiles(directory=directory, cache=file_cache)),
+    ])
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=30) as client:
+            etags = {}
+            for prefix in ("/plain", "/uploads"):
+                for path in small:
+                    etags[prefix, path] = (await client.get(f"{prefix}/{path}")).headers["etag"]
+
+            def small_file(prefix):
+                return f"{prefix}/{random.choice(small)}", {}, 200
+
+            def large_file(prefix):
+                return f"{prefix}/{random.choice(large)}", {}, 200
+
+            def byte_range(prefix):
+                start = random.randrange(LARGE_SIZE - 2 ** 20)
+                return f"{prefix}/{random.choice(large)}", {"Range": f"bytes={start}-{start + 2 ** 20 - 1}"}, 206
+
+            def revalidation(prefix):
+                path = random.choice(small)
+                return f"{prefix}/{path}", {"If-None-Match": etags[prefix, path]}, 304
+
+            scenarios = {"small": small_file, "large": large_file, "range": byte_range, "revalid": revalidation}
+
+            print(f"{'scenario':>9} {'mount':>8} {'req/s':>10} {'MB/s':>10}")
+            for name, make in scenarios.items():
+                for prefix in ("/plain", "/uploads"):
+                    if name == "range" and prefix == "/plain":
+                        # StaticFiles ignores Range and always sends the whole file
+                        rps, mbps = await run(client, args.clients, args.duration, lambda: large_file(prefix))
+                        label = "plain*"
+                    else:
+                        rps, mbps = await run(client, args.clients, args.duration, lambda: make(prefix))
+                        label = prefix.strip("/")
+                    print(f"{name:>9} {label:>8} {rps:>10.1f} {mbps:>10.1f}")
+            print("\n* StaticFiles has no range support; it sends the full file instead")
+            print(f"file cache: {file_cache.hits} hits, {file_cache.misses} misses, {file_cache.size / 1024 / 1024:.1f} MB")
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
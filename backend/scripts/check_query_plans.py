@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Fail if any router query falls back to a full table scan or a sort.
+
+Drives every endpoint in-process against a throwaway SQLite database, captures
+the SQL each request issues, and runs EXPLAIN QUERY PLAN on every captured
+statement. A plan step that scans a content table without an index, or builds
+a temporary B-tree to satisfy ORDER BY, is reported and the script exits 1.
+
+Usage:
+    python scripts/check_query_plans.py [--rows 500] [--verbose]
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Point the app at a scratch database before any app module is imported
+_tmpdir = tempfile.mkdtemp(prefix="blog-plans-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/plans.db"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+os.makedirs(os.environ["UPLOAD_DIR"], exist_ok=True)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from app.database import engine, async_engine, read_engine, SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.admin import Admin  # noqa: E402
+from app.models.contact import Contact  # noqa: E402
+from app.models.post import Post  # noqa: E402
+from app.models.service import Service  # noqa: E402
+from app.utils.security import get_password_hash  # noqa: E402
+
+# Tables whose size grows with content; small bookkeeping tables may be scanned
+CONTENT_TABLES = ("posts", "services", "contacts", "admins")
+TABLE_SCAN = re.compile(r"^SCAN (%s)\b(?!.*USING)" % "|".join(CONTENT_TABLES))
+TEMP_SORT = re.compile(r"USE TEMP B-TREE FOR (ORDER BY|RIGHT PART OF ORDER BY)")
+
+
+def seed(rows: int):
+    db = SessionLocal()
+    try:
+        db.add(Admin(username="admin", hashed_password=get_password_hash("admin1234")))
+        db.add_all([
+            Post(title_ko=f"게시글 {i}", content_ko="본문", is_public=i % 4 != 0)
+            for i in range(rows)
+        ])
+        db.add_all([
+            Service(title_ko=f"서비스 {i}", description_ko="설명", order=i % 7,
+                    is_published=i % 5 != 0, is_featured=i % 3 == 0)
+            for i in range(rows // 10)
+        ])
+        db.add_all([
+            Contact(name=f"문의 {i}", contact="010", message="내용", is_read=i % 2 == 0)
+            for i in range(rows)
+        ])
+        db.commit()
+    finally:
+        db.close()
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def exercise(client: TestClient):
+    """Hit every endpoint at least once, following cursors in both directions."""
+    token = client.post("/api/auth/login", json={"username": "admin", "password": "admin1234"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for path, auth in (
+        ("/api/posts", None), ("/api/services", None), ("/api/contacts", None),
+        ("/api/admin/posts", headers), ("/api/admin/services", headers), ("/api/admin/contacts", headers),
+    ):
+        page = client.get(path, headers=auth, params={"page": 3}).json()
+        client.get(path, headers=auth, params={"after": page["next_cursor"]})
+        client.get(path, headers=auth, params={"before": page["prev_cursor"]})
+
+    client.get("/api/home")
+    client.get("/api/services/featured")
+    client.get("/api/posts/2")
+    client.get("/api/services/2")
+    client.get("/api/contacts/2", headers=headers)
+    client.get("/api/auth/me", headers=headers)
+    client.get("/api/admin/dashboard", headers=headers)
+    client.get("/api/admin/contacts/3", headers=headers)
+
+    post_id = client.post("/api/posts", headers=headers, json={"title_ko": "새 글", "content_ko": "본문"}).json()["id"]
+    client.put(f"/api/posts/{post_id}", headers=headers, json={"is_public": False})
+    client.delete(f"/api/posts/{post_id}", headers=headers)
+    service_id = client.post("/api/services", headers=headers, json={"title_ko": "새 서비스", "description_ko": "설명"}).json()["id"]
+    client.put(f"/api/services/{service_id}", headers=headers, json={"is_featured": True})
+    client.delete(f"/api/services/{service_id}", headers=headers)
+    contact_id = client.post("/api/contacts", json={"name": "n", "contact": "c", "message": "m"}).json()["id"]
+    client.put(f"/api/admin/contacts/{contact_id}/reply", headers=headers, json={"admin_reply": "답변"})
+    client.delete(f"/api/admin/contacts/{contact_id}", headers=headers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+    verbose = args.verbose
+
+    statements = {}
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")) and not executemany:
+            statements.setdefault(statement, parameters)
+
+    for api_engine in (async_engine, read_engine):
+        event.listen(api_engine.sync_engine, "before_cursor_execute", capture)
+
+    with TestClient(app) as client:
+        seed(args.rows)
+        statements.clear()
+        exercise(client)
+
+    failures = []
+    with engine.connect() as conn:
+        raw = conn.connection.driver_connection
+        for statement, parameters in statements.items():
+            plan = raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            if verbose:
+                print(" ".join(statement.split()))
+                for row in plan:
+                    print(f"    {row[-1]}")
+            bad = [row[-1] for row in plan if TABLE_SCAN.search(row[-1]) or TEMP_SORT.search(row[-1])]
+            if bad:
+                failures.append((statement, bad))
+
+    print(f"Checked {len(statements)} statements")
+    for statement, bad in failures:
+        print("\n" + " ".join(statement.split()))
+        for detail in bad:
+            print(f"  -> {detail}")
+
+    if failures:
+        print(f"\n{len(failures)} statement(s) regressed to a table scan or sort")
+        sys.exit(1)
+    print("All query plans use indexes")
+
+
+if __name__ == "__main__":
+    main()
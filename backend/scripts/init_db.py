@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import Base, engine, SessionLocal
+from app.migrations import run_migrations
 from app.models.admin import Admin
 from app.utils.security import get_password_hash
 
@@ -20,6 +21,11 @@ def init_db():
     Base.metadata.create_all(bind=engine)
     print("Tables created successfully!")
 
+    with engine.begin() as conn:
+        applied = run_migrations(conn)
+    if applied:
+        print(f"Applied migrations: {', '.join(map(str, applied))}")
+
 
 def create_default_admin():
     """Create default admin user if not exists."""
@@ -1,17 +1,43 @@
 #!/usr/bin/env python3
 """
 Seed the database with mock data for development.
+
+With --generate, fill it with synthetic data at production scale instead,
+for load testing:
+
+    python scripts/seed_data.py --generate --posts 100000 --services 500 --contacts 200000
+
+Generated rows have realistic multilingual text lengths (log-normal, with
+optional English/Chinese translations), timestamps skewed towards the
+recent past, and typical public/secret/replied ratios. Everything is
+inserted with Core executemany batches in a single transaction, with
+durability PRAGMAs relaxed and the counter/version triggers dropped for
+the duration; counters, table versions and the search index are rebuilt
+once at the end. Rows per second are reported per table.
 """
+import argparse
+import math
+import random
 import sys
 import os
+import time
+from datetime import datetime, timedelta
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import SessionLocal
+from sqlalchemy import bindparam, insert, text
+
+from app.database import Base, SessionLocal, engine, apply_sqlite_pragmas, sqlite_pragmas
+from app.migrations import run_migrations
 from app.models.post import Post
 from app.models.contact import Contact
+from app.models.service import Service
+from app.services.search import rebuild_search_index
+from app.services.stats import install_counter_triggers, recompute_counters
+from app.services.versions import install_version_triggers, bump_table_versions
 from app.utils.security import get_password_hash
+import app.services.search  # noqa: F401  (keeps the search index in sync)
 
 
 MOCK_POSTS = [
@@ -309,7 +335,217 @@ def seed_contacts(db):
     print(f"  Created {len(MOCK_CONTACTS)} contacts")
 
 
-def main():
+# ============ Synthetic data (--generate) ============
+
+# Durability is pointless while loading throwaway data; restored afterwards
+LOAD_PRAGMAS = {"synchronous": "OFF", "cache_size": -262144, "temp_store": "MEMORY"}
+
+GENERATED_TABLES = (Post.__tablename__, Service.__tablename__, Contact.__tablename__)
+
+# Password of every generated secret contact (hashed once and shared)
+GENERATED_SECRET_PASSWORD = "secret1234"
+
+WORDS = {
+    "ko": (
+        "비자 연장 체류자격 변경 외국인 등록 신청 서류 여권 사증 출입국 관리 사무소 방문 예약 "
+        "상담 안내 절차 수수료 발급 기간 결혼 이민 취업 유학 연수 근로 계약서 재직 증명서 "
+        "사업자 등록증 사본 제출 확인 처리 결과 통보 가족 초청 영주권 귀화 시험 행정사 대행 "
+        "서비스 문의 전화 이메일 주소 변경 신고 분실 재발급 체류지 연락처 세종 조치원 민원"
+    ).split(),
+    "en": (
+        "visa extension status residence change alien registration application documents passport "
+        "immigration office visit appointment consultation guide procedure fee issuance period "
+        "marriage migration employment study training contract certificate business registration "
+        "copy submit confirm processing result notice family invitation permanent naturalization "
+        "exam administrative agent service inquiry phone email address report lost reissue the "
+        "of and to for your with our please within days required additional"
+    ).split(),
+    "zh": (
+        "签证 延期 居留 资格 变更 外国人 登录 申请 材料 护照 出入境 管理 事务所 访问 预约 咨询 "
+        "指南 手续 费用 签发 期限 结婚 移民 就业 留学 研修 劳动 合同 在职 证明 营业 执照 副本 "
+        "提交 确认 处理 结果 通知 家属 邀请 永住 归化 考试 行政士 代办 服务 电话 地址 报告 补办"
+    ).split(),
+}
+
+# Typical text lengths in characters: (median, spread) of a log-normal
+TITLE_LENGTHS = {"ko": (22, 0.35), "en": (48, 0.35), "zh": (16, 0.35)}
+BODY_LENGTHS = {"ko": (900, 0.7), "en": (1600, 0.7), "zh": (600, 0.7)}
+MESSAGE_LENGTH = (180, 0.8)
+REPLY_LENGTH = (320, 0.6)
+
+NAMES = ["김민수", "이지은", "박서준", "최유진", "John Smith", "Maria Garcia", "Nguyen Van An", "王伟", "李娜", "Tanaka Yuki"]
+ICONS = ["FileText", "Plane", "Users", "Briefcase", "GraduationCap", "Home", "Heart", "Globe", "Shield", "Phone"]
+
+
+class TextGenerator:
+    """
+    Random text of a given length, sliced from a pre-built corpus per language.
+
+    Slicing keeps generation cheap enough for millions of rows while still
+    producing searchable words in each language.
+    """
+
+    def __init__(self, rng: random.Random, corpus_size: int = 200_000):
+        self.rng = rng
+        self.corpus = {}
+        for lang, words in WORDS.items():
+            separator = "" if lang == "zh" else " "
+            parts, size = [], 0
+            while size < corpus_size:
+                sentence = separator.join(rng.choice(words) for _ in range(rng.randint(5, 14)))
+                sentence += "。" if lang == "zh" else ". "
+                parts.append(sentence)
+                size += len(sentence)
+                if rng.random() < 0.15:
+                    parts.append("\n\n")
+            self.corpus[lang] = "".join(parts)
+
+    def length(self, median: int, spread: float, limit: int = None) -> int:
+        value = max(1, int(self.rng.lognormvariate(math.log(median), spread)))
+        return min(value, limit) if limit else value
+
+    def text(self, lang: str, length: int) -> str:
+        corpus = self.corpus[lang]
+        length = min(length, len(corpus))
+        start = self.rng.randrange(len(corpus) - length + 1)
+        return corpus[start:start + length].strip() or self.rng.choice(WORDS[lang])
+
+
+def skewed_timestamp(rng: random.Random, now: datetime, span_days: int) -> datetime:
+    """A time in the last `span_days`, weighted towards recent (most content is new)."""
+    return (now - timedelta(seconds=span_days * 86400 * rng.random() ** 3)).replace(microsecond=0)
+
+
+def generate_posts(rng: random.Random, texts: TextGenerator, now: datetime, count: int):
+    for i in range(count):
+        created_at = skewed_timestamp(rng, now, 3 * 365)
+        row = {"is_public": rng.random() < 0.9, "created_at": created_at, "thumbnail_url": None}
+        for lang, probability in (("ko", 1.0), ("en", 0.7), ("zh", 0.4)):
+            present = rng.random() < probability
+            row[f"title_{lang}"] = texts.text(lang, texts.length(*TITLE_LENGTHS[lang], limit=200)) if present else None
+            row[f"content_{lang}"] = texts.text(lang, texts.length(*BODY_LENGTHS[lang])) if present else None
+        if rng.random() < 0.3:
+            row["thumbnail_url"] = f"https://picsum.photos/seed/post{i}/640/360"
+        # Heavy-tailed popularity: a few posts get most views
+        row["view_count"] = min(int(rng.paretovariate(1.2) * 10) - 10, 1_000_000)
+        row["updated_at"] = created_at + timedelta(days=rng.random() * 30) if rng.random() < 0.2 else None
+        yield row
+
+
+def generate_services(rng: random.Random, texts: TextGenerator, now: datetime, count: int):
+    for i in range(count):
+        row = {
+            "icon": rng.choice(ICONS),
+            "is_published": rng.random() < 0.85,
+            "is_featured": rng.random() < 0.1,
+            "order": rng.randint(0, 100),
+            "created_at": skewed_timestamp(rng, now, 3 * 365),
+            "updated_at": None,
+        }
+        for lang, probability in (("ko", 1.0), ("en", 0.8), ("zh", 0.6)):
+            present = rng.random() < probability
+            row[f"title_{lang}"] = texts.text(lang, texts.length(*TITLE_LENGTHS[lang], limit=200)) if present else None
+            row[f"description_{lang}"] = texts.text(lang, texts.length(300, 0.5)) if present else None
+        yield row
+
+
+def generate_contacts(rng: random.Random, texts: TextGenerator, now: datetime, count: int, password_hash: str):
+    for i in range(count):
+        created_at = skewed_timestamp(rng, now, 2 * 365)
+        lang = rng.choices(("ko", "en", "zh"), weights=(6, 3, 1))[0]
+        is_secret = rng.random() < 0.3
+        # Older inquiries are more likely to have been answered
+        replied = rng.random() < 0.75 and created_at < now - timedelta(days=3 * rng.random())
+        yield {
+            "name": rng.choice(NAMES),
+            "contact": f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}" if rng.random() < 0.7 else f"user{i}@example.com",
+            "message": texts.text(lang, texts.length(*MESSAGE_LENGTH)),
+            "is_secret": is_secret,
+            "secret_password": password_hash if is_secret else None,
+            "admin_reply": texts.text(lang, texts.length(*REPLY_LENGTH)) if replied else None,
+            "reply_is_public": rng.random() < 0.8,
+            "replied_at": created_at + timedelta(hours=rng.random() * 72) if replied else None,
+            "is_read": replied or rng.random() < 0.6,
+            "created_at": created_at,
+        }
+
+
+def bulk_insert(conn, model, rows, batch_size: int) -> int:
+    """executemany INSERT of a row generator in batches; returns the row count."""
+    statement = insert(model.__table__)
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.execute(statement, batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        conn.execute(statement, batch)
+        total += len(batch)
+    return total
+
+
+def generate(posts: int, services: int, contacts: int, batch_size: int, seed: int):
+    """Insert synthetic rows in one transaction and report rows per second."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        run_migrations(conn)
+        install_counter_triggers(conn)
+        install_version_triggers(conn)
+
+    print("Preparing text corpus...")
+    texts = TextGenerator(rng)
+    password_hash = get_password_hash(GENERATED_SECRET_PASSWORD) if contacts else None
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        dbapi_connection = conn.connection.dbapi_connection
+        apply_sqlite_pragmas(dbapi_connection, LOAD_PRAGMAS)
+        try:
+            with conn.begin():
+                # Per-row triggers would double the cost of the load; recreate them afterwards
+                triggers = conn.execute(
+                    text("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name IN :tables")
+                    .bindparams(bindparam("tables", expanding=True)),
+                    {"tables": list(GENERATED_TABLES)}
+                ).all()
+                for name, _ in triggers:
+                    conn.execute(text(f"DROP TRIGGER {name}"))
+
+                print(f"{'table':>10} {'rows':>10} {'seconds':>9} {'rows/s':>10}")
+                for model, rows in (
+                    (Post, generate_posts(rng, texts, now, posts)),
+                    (Service, generate_services(rng, texts, now, services)),
+                    (Contact, generate_contacts(rng, texts, now, contacts, password_hash)),
+                ):
+                    table_started = time.perf_counter()
+                    inserted = bulk_insert(conn, model, rows, batch_size)
+                    elapsed = time.perf_counter() - table_started
+                    print(f"{model.__tablename__:>10} {inserted:>10} {elapsed:>9.2f} {inserted / max(elapsed, 1e-9):>10.0f}")
+
+                finishing = time.perf_counter()
+                for _, sql in triggers:
+                    conn.execute(text(sql))
+                recompute_counters(conn)
+                bump_table_versions(conn, Post.__tablename__, Service.__tablename__)
+                rebuild_search_index(conn)
+                print(f"Rebuilt counters and search index in {time.perf_counter() - finishing:.2f}s")
+        finally:
+            apply_sqlite_pragmas(dbapi_connection, sqlite_pragmas())
+
+    total = posts + services + contacts
+    elapsed = time.perf_counter() - started
+    print(f"\nGenerated {total} rows in {elapsed:.2f}s ({total / max(elapsed, 1e-9):.0f} rows/s)")
+    if contacts:
+        print(f"Secret contacts use the password '{GENERATED_SECRET_PASSWORD}'")
+
+
+def seed_mock_data():
     db = SessionLocal()
     try:
         # Check if data already exists
@@ -330,5 +566,21 @@ def main():
         db.close()
 
 
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generate", action="store_true", help="insert synthetic data instead of the mock data")
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--services", type=int, default=100)
+    parser.add_argument("--contacts", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=None, help="random seed, for reproducible data")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.posts, args.services, args.contacts, args.batch_size, args.seed)
+    else:
+        seed_mock_data()
+
+
 if __name__ == "__main__":
     main()
@@ -19,11 +19,21 @@ export function PostCard({ post }: PostCardProps) {
       <Card className="h-full overflow-hidden hover:shadow-sm transition-shadow">
         <div className="aspect-video bg-muted overflow-hidden">
           {post.thumbnail_url ? (
-            <img
-              src={post.thumbnail_url}
-              alt={title}
-              className="w-full h-full object-cover"
-            />
+            <picture>
+              {Object.entries(post.thumbnail_srcset ?? {}).map(([type, srcSet]) => (
+                <source
+                  key={type}
+                  type={type}
+                  srcSet={srcSet}
+                  sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
+                />
+              ))}
+              <img
+                src={post.thumbnail_url}
+                alt={title}
+                className="w-full h-full object-cover"
+              />
+            </picture>
           ) : (
             <div className="w-full h-full bg-muted" />
           )}
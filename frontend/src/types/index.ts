@@ -20,6 +20,7 @@ export interface PostListItem {
   title_en: string | null
   title_zh: string | null
   thumbnail_url: string | null
+  thumbnail_srcset?: Record<string, string> | null
   is_public: boolean
   view_count: number
   created_at: string
@@ -93,6 +94,8 @@ export interface PaginatedResponse<T> {
   page: number
   limit: number
   total_pages: number
+  next_cursor?: string | null
+  prev_cursor?: string | null
 }
 
 // Service types